@@ -33,6 +33,7 @@ class Redmine:
         :param timezone: (optional). Whether to convert a naive datetime to a specific timezone aware one.
         :type timezone: str or cls
         :param cls engine: (optional). Engine that will be used to make requests to Redmine.
+        :param bool identity_map: (optional). Whether nested resources with the same id should share one object.
         """
         self.url = url.rstrip('/')
         self.ver = kwargs.pop('version', None)
@@ -48,9 +49,10 @@ class Redmine:
             except (TypeError, ValueError):
                 raise exceptions.TimezoneError
 
-        self.date_format = kwargs.pop('date_format', '%Y-%m-%d')
-        self.datetime_format = kwargs.pop('datetime_format', '%Y-%m-%dT%H:%M:%SZ')
+        self.date_format = kwargs.pop('date_format', resources.base.DATE_FORMAT)
+        self.datetime_format = kwargs.pop('datetime_format', resources.base.DATETIME_FORMAT)
         self.raise_attr_exception = kwargs.pop('raise_attr_exception', True)
+        self.identity_map = utilities.IdentityMap() if kwargs.pop('identity_map', False) else None
 
         engine = kwargs.pop('engine', engines.DefaultEngine)
 
@@ -68,7 +70,7 @@ class Redmine:
         if resource_name.startswith('_'):
             raise AttributeError
 
-        resource_name = ''.join(word[0].upper() + word[1:] for word in str(resource_name).split('_'))
+        resource_name = utilities.to_resource_name(str(resource_name))
 
         try:
             resource_class = resources.registry[resource_name]['class']
@@ -83,19 +85,53 @@ class Redmine:
     @contextlib.contextmanager
     def session(self, **options):
         """
-        Initiates a temporary session with a copy of the current engine but with new options.
+        Initiates a temporary session with a copy of the current engine but with new options. Copy of the engine
+        reuses session objects of the current engine, so connections to Redmine are reused as well, rate limits
+        and cache are shared too unless new ones are set for a session, retries, chunk and prefetch settings are
+        taken from the current engine as well. If connection pool options are set for a session, a new session
+        object with its own connection pool is created instead and it's closed when the session ends.
 
         :param dict options: (optional). Engine's options for a session.
         """
         engine = self.engine
-        self.engine = engine.__class__(
-            requests=utilities.merge_dicts(engine.requests, options.pop('requests', {})), **options)
+        defaults = {
+            'session': engine.session, 'limiter': engine.limiter, 'cache': engine.cache, 'cache_ttl': engine.cache_ttl,
+            'json_backend': engine.json_backend, 'retries': engine.retry, 'prefetch': engine.prefetch,
+            'chunk': engine.chunk, 'chunk_time': engine.chunk_time, 'chunk_bytes': engine.chunk_bytes,
+            'pool_connections': engine.pool_connections, 'pool_maxsize': engine.pool_maxsize,
+            'pool_block': engine.pool_block, 'keep_alive': engine.keep_alive,
+        }
+
+        # Chunk bounds are kept only if chunk adapts, otherwise they should follow the chunk set for a session
+        if engine.min_chunk != engine.max_chunk:
+            defaults.update(min_chunk=engine.min_chunk, max_chunk=engine.max_chunk)
+
+        if hasattr(engine, 'workers'):
+            defaults['workers'] = engine.workers
+
+        requests = utilities.merge_dicts(engine.requests, options.pop('requests', {}))
+
+        # Connection pool is a part of a session object, so a new one is needed to apply new pool options
+        new_pool = bool({'pool_connections', 'pool_maxsize', 'pool_block', 'keep_alive'} & options.keys())
+
+        if new_pool:
+            del defaults['session']
+
+        # Asynchronous sessions are reused as well unless they have to be created with different options
+        if hasattr(engine, 'async_parent') and not new_pool and all(
+                engine.requests.get(key) == requests.get(key) for key in ('verify', 'cert')):
+            defaults['async_parent'] = engine.async_parent or engine
+
+        self.engine = engine.__class__(requests=requests, **dict(defaults, **options))
 
         try:
             yield self
         except exceptions.BaseRedmineError as e:
             raise e
         finally:
+            if new_pool:
+                self.engine.session.close()
+
             self.engine = engine
 
     def upload(self, f, filename=None):
@@ -2,7 +2,13 @@
 Defines engines for processing requests/responses to/from Redmine.
 """
 
+from .retry import Retry
+from .limiter import RateLimiter
+from .cache import BaseCache, MemoryCache, FileCache
+from .serializers import JSONBackend, get_json_backend
 from .base import BaseEngine
 from .sync import SyncEngine
+from .thread import ThreadEngine
+from .aio import AsyncEngine
 
 DefaultEngine = SyncEngine
@@ -0,0 +1,221 @@
+"""
+Asynchronous engine that processes awaitable requests on an asyncio event loop using HTTPX client.
+Blocking requests are still processed one by one like in the synchronous engine.
+"""
+
+import time
+import asyncio
+import itertools
+
+from . import SyncEngine
+
+
+class AsyncEngine(SyncEngine):
+    def __init__(self, **options):
+        """
+        :param int workers: (optional). How many pages of a bulk request can be retrieved concurrently.
+        :param async_parent: (optional). Engine whose asynchronous sessions should be reused instead of new ones.
+        :type async_parent: engines.AsyncEngine
+        """
+        self.workers = options.pop('workers', None) or 10
+        self.async_parent = options.pop('async_parent', None)
+        self._async_session = None
+        self._async_session_loop = None
+        self._async_session_guard = None
+        super().__init__(**options)
+
+    def create_async_session(self, **params):
+        """
+        Creates an asynchronous session object that will be used to make awaitable requests to Redmine.
+
+        :param dict params: (optional). Session params.
+        """
+        import httpx
+
+        # HTTPX client has a single connection pool for all hosts and always waits for a free connection
+        limits = httpx.Limits(max_connections=self.pool_connections * self.pool_maxsize,
+                              max_keepalive_connections=self.pool_maxsize if self.keep_alive else 0)
+        return httpx.AsyncClient(verify=params.get('verify', True), cert=params.get('cert'), limits=limits,
+                                 follow_redirects=True)
+
+    @property
+    def async_session(self):
+        """
+        Returns an asynchronous session bound to the running event loop, a new one is created for each new loop
+        and the previous one is closed. Session of the parent engine is returned if the engine has a parent.
+        """
+        if self.async_parent is not None:
+            return self.async_parent.async_session
+
+        loop = asyncio.get_running_loop()
+
+        if self._async_session is None or self._async_session_loop is not loop:
+            self.discard_async_session()
+            self._async_session = self.create_async_session(**self.requests)
+            self._async_session_loop = loop
+            self._async_session_guard = loop.create_task(self.aclose_on_shutdown(self._async_session))
+
+        return self._async_session
+
+    @staticmethod
+    async def aclose_on_shutdown(session):
+        """
+        Waits until cancelled and closes an asynchronous session. It runs as a task on the session's event loop,
+        asyncio.run() cancels all the remaining tasks before closing the loop, so the session is closed while
+        its connections can still be closed too.
+
+        :param obj session: (required). Asynchronous session object.
+        """
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            await session.aclose()
+
+    def discard_async_session(self):
+        """
+        Forgets an asynchronous session and schedules its closing on the event loop it's bound to. If the loop
+        has already been closed, the session was closed on the loop's shutdown.
+        """
+        loop, guard = self._async_session_loop, self._async_session_guard
+        self._async_session = self._async_session_loop = self._async_session_guard = None
+
+        if guard is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(guard.cancel)
+
+    def construct_async_request_kwargs(self, method, headers, params, data):
+        """
+        Converts kwargs constructed for all requests to Redmine into kwargs supported by an asynchronous session.
+
+        :param string method: (required). HTTP verb to use for the request.
+        :param dict headers: (required). HTTP headers to send with the request.
+        :param dict params: (required). Params to send in the query string.
+        :param data: (required). Data to send in the body of the request.
+        :type data: dict, bytes or file-like object
+        """
+        kwargs = self.construct_request_kwargs(method, headers, params, data)
+        async_kwargs = {'params': kwargs['params'], 'headers': kwargs['headers']}
+
+        if kwargs['data']:
+            async_kwargs['data' if isinstance(kwargs['data'], dict) else 'content'] = kwargs['data']
+
+        for key in ('auth', 'cookies'):
+            if kwargs.get(key) is not None:
+                async_kwargs[key] = kwargs[key]
+
+        if kwargs.get('timeout') is not None:
+            timeout = kwargs['timeout']
+
+            # Requests' (connect, read) tuple should be converted to a format understood by HTTPX
+            if isinstance(timeout, tuple):
+                import httpx
+                timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+
+            async_kwargs['timeout'] = timeout
+
+        return async_kwargs
+
+    async def arequest(self, method, url, headers=None, params=None, data=None):
+        return (await self.araw_request(method, url, headers, params, data))[0]
+
+    async def araw_request(self, method, url, headers=None, params=None, data=None):
+        """
+        Makes a single awaitable request to Redmine and returns processed response together with the response
+        object, the latter is None if response was taken from the cache.
+
+        :param string method: (required). HTTP verb to use for the request.
+        :param string url: (required). URL of the request.
+        :param dict headers: (optional). HTTP headers to send with the request.
+        :param dict params: (optional). Params to send in the query string.
+        :param data: (optional). Data to send in the body of the request.
+        :type data: dict, bytes or file-like object
+        """
+        import httpx
+        kwargs = self.construct_async_request_kwargs(method, headers, params, data)
+        key, entry = self.get_cache_entry(method, url, kwargs)
+
+        if entry is not None:
+            if entry['expires'] > time.time():
+                return self.process_cache_entry(entry), None
+
+            kwargs['headers'] = dict(kwargs['headers'], **entry['validators'])
+
+        for attempt in itertools.count():
+            try:
+                async with self.limiter.alimit():
+                    response = await self.async_session.request(method.upper(), url, **kwargs)
+            except httpx.TransportError:
+                delay = self.get_retry_delay(method, attempt)
+
+                if delay is None:
+                    raise
+            else:
+                delay = self.get_retry_delay(method, attempt, response)
+
+                if delay is None:
+                    break
+
+                await response.aclose()
+
+            await asyncio.sleep(delay)
+
+        self.invalidate_cache(method, url)
+
+        if key is not None:
+            return self.process_cacheable_response(key, entry, response), response
+
+        return self.process_response(response), response
+
+    async def atimed_request(self, method, url, container, **params):
+        """
+        Awaitable counterpart of the timed_request method.
+
+        :param string method: (required). HTTP verb to use for the request.
+        :param string url: (required). URL of the request.
+        :param string container: (required). Key in the response that should be used to access retrieved resources.
+        :param dict params: (optional). Params that should be used for resource retrieval.
+        """
+        started = time.monotonic()
+        response, raw_response = await self.araw_request(method, url, params=params)
+        return response, self.adapt_to_response(
+            response, raw_response, container, params['limit'], time.monotonic() - started)
+
+    async def abulk_request(self, method, url, container, **params):
+        limit = params.get('limit') or 0
+        offset = params.get('offset') or 0
+        response, chunk = await self.atimed_request(
+            method, url, container, **dict(params, limit=limit or self.first_chunk, offset=offset))
+        results, total_count, bulk_params = self.split_bulk_request(response, container, chunk, **params)
+
+        if bulk_params:
+            semaphore = asyncio.Semaphore(self.workers)
+
+            async def fetch(page_params):
+                async with semaphore:
+                    return (await self.arequest(method, url, params=page_params))[container]
+
+            # gather() returns results in the order of bulk_params, so resources are kept in offset order
+            for page in await asyncio.gather(*(fetch(page_params) for page_params in bulk_params)):
+                results.extend(page)
+
+        return results, total_count
+
+    async def aconcurrent_map(self, function, items, workers=None):
+        return await super().aconcurrent_map(function, items, workers or self.workers)
+
+    async def aclose(self):
+        """
+        Closes an asynchronous session and all the connections it holds, session of the parent engine is
+        left open as it's owned by the parent.
+        """
+        session, guard = self._async_session, self._async_session_guard
+
+        if session is not None and self._async_session_loop is asyncio.get_running_loop():
+            self._async_session = self._async_session_loop = self._async_session_guard = None
+            guard.cancel()
+            await session.aclose()
+        elif session is not None:
+            self.discard_async_session()
+
+    def __getstate__(self):
+        # Asynchronous session is bound to an event loop, so it can't be pickled
+        return dict(super().__getstate__(), _async_session=None, _async_session_loop=None, _async_session_guard=None)
@@ -2,14 +2,28 @@
 Base engine that defines common behaviour and settings for all engines.
 """
 
+import os
 import json
+import time
+import asyncio
 import warnings
-
+import functools
+import threading
+import itertools
+import collections
+import urllib.parse
+import concurrent.futures
+
+from .retry import Retry
+from .limiter import RateLimiter
+from .cache import MemoryCache
+from .serializers import get_json_backend
 from .. import exceptions
 
 
 class BaseEngine:
     chunk = 100
+    retry_exceptions = ()
 
     def __init__(self, **options):
         """
@@ -21,7 +35,66 @@ class BaseEngine:
         :param bool ignore_response (optional). If True no response processing will be done at all.
         :param bool return_response (optional). Whether to return response or None.
         :param bool return_raw_response (optional). Whether to return raw or json encoded responses.
+        :param int prefetch (optional). How many pages to request ahead while streaming resources.
+        :param int chunk (optional). How many resources to request at once during bulk requests.
+        :param int min_chunk (optional). Lower bound of chunk size, enables chunk size adaptation if less than max.
+        :param int max_chunk (optional). Upper bound of chunk size, enables chunk size adaptation if more than min.
+        :param float chunk_time (optional). Desired time in seconds a single request should take to adapt chunk to.
+        :param int chunk_bytes (optional). Desired maximum size of a single response in bytes to adapt chunk to.
+        :param any session (optional). Existing session object to reuse instead of creating a new one.
+        :param int pool_connections (optional). How many hosts to keep connection pools for.
+        :param int pool_maxsize (optional). Maximum number of connections to keep in a pool for a single host.
+        :param bool pool_block (optional). Whether to wait for a free connection when a pool is exhausted.
+        :param bool keep_alive (optional). Whether to keep connections open to reuse them for the next requests.
+        :param retries: (optional). How many times to retry requests failed due to transient errors or retry policy.
+        :type retries: int or engines.Retry
+        :param float rate_limit (optional). How many requests per second can be made on average.
+        :param int rate_burst (optional). How many requests can be made at once after a period of inactivity.
+        :param int max_in_flight (optional). How many requests can be made at the same time.
+        :param limiter: (optional). Existing rate limiter to share instead of creating a new one.
+        :type limiter: engines.RateLimiter
+        :param cache: (optional). Cache to store responses to GET requests in, True to use an in-memory cache.
+        :type cache: bool or engines.BaseCache
+        :param float cache_ttl (optional). How many seconds cached responses are used without revalidation.
+        :param json_backend: (optional). JSON backend name, i.e. auto, orjson, ujson, simdjson, json or an instance.
+        :type json_backend: string or engines.JSONBackend
         """
+        self.prefetch = options.pop('prefetch', 0)
+        self.chunk = options.pop('chunk', None) or self.chunk
+        self.min_chunk = options.pop('min_chunk', None) or self.chunk
+        self.max_chunk = options.pop('max_chunk', None) or self.chunk
+        self.chunk_time = options.pop('chunk_time', 1.0)
+        self.chunk_bytes = options.pop('chunk_bytes', None)
+        self.server_chunk = None
+        self.pool_connections = options.pop('pool_connections', None) or 10
+        self.pool_maxsize = options.pop('pool_maxsize', None) or 10
+        self.pool_block = options.pop('pool_block', False)
+        self.keep_alive = options.pop('keep_alive', True)
+        self.retry = options.pop('retries', None)
+
+        if isinstance(self.retry, int):
+            self.retry = Retry(total=self.retry)
+
+        self.limiter = options.pop('limiter', None)
+
+        if self.limiter is None or {'rate_limit', 'rate_burst', 'max_in_flight'} & options.keys():
+            self.limiter = RateLimiter(
+                options.pop('rate_limit', None), options.pop('rate_burst', None), options.pop('max_in_flight', None))
+
+        self.cache = options.pop('cache', None)
+        self.cache_ttl = options.pop('cache_ttl', 300)
+
+        if self.cache is True:
+            self.cache = MemoryCache()
+        elif self.cache is False:
+            self.cache = None
+
+        self.json_backend = options.pop('json_backend', None)
+
+        if isinstance(self.json_backend, str):
+            self.json_backend = get_json_backend(self.json_backend)
+
+        self._local = threading.local()
         self.ignore_response = options.pop('ignore_response', False)
         self.return_response = options.pop('return_response', True)
         self.return_raw_response = options.pop('return_raw_response', False)
@@ -30,6 +103,9 @@ class BaseEngine:
         if self.ignore_response:
             self.requests['stream'] = True
 
+        if not self.keep_alive:
+            self.requests['headers']['Connection'] = 'close'
+
         if options.get('impersonate') is not None:
             self.requests['headers']['X-Redmine-Switch-User'] = options['impersonate']
 
@@ -39,12 +115,12 @@ class BaseEngine:
         elif options.get('username') is not None and options.get('password') is not None:
             self.requests['auth'] = (options['username'], options['password'])
 
-        self.session = self.create_session(**self.requests)
+        self.session = options.pop('session', None) or self.create_session(**self.requests)
 
-    @staticmethod
-    def create_session(**params):
+    def create_session(self, **params):
         """
-        Creates a session object that will be used to make requests to Redmine.
+        Creates a session object that will be used to make requests to Redmine. Engine's
+        pool_connections, pool_maxsize, pool_block and keep_alive settings should be respected.
 
         :param dict params: (optional). Session params.
         """
@@ -60,10 +136,17 @@ class BaseEngine:
         :param data: (required). Data to send in the body of the request.
         :type data: dict, bytes or file-like object
         """
-        kwargs = dict(self.requests, **{'data': data or {}, 'params': params or {}, 'headers': headers or {}})
+        # All options are sent with each request instead of being set on a session object, this way
+        # a session and its connection pool can be safely shared between engines with different options
+        kwargs = dict(self.requests, **{
+            'data': data or {},
+            'params': dict(self.requests['params'], **(params or {})),
+            'headers': dict(self.requests['headers'], **(headers or {})),
+        })
 
         if method in ('post', 'put', 'patch') and 'Content-Type' not in kwargs['headers']:
-            kwargs['data'] = json.dumps(data)
+            dumps = json.dumps if self.json_backend is None else self.json_backend.dumps
+            kwargs['data'] = dumps(data)
             kwargs['headers']['Content-Type'] = 'application/json'
 
         return kwargs
@@ -80,7 +163,212 @@ class BaseEngine:
         :type data: dict, bytes or file-like object
         """
         kwargs = self.construct_request_kwargs(method, headers, params, data)
-        return self.process_response(self.session.request(method, url, **kwargs))
+        key, entry = self.get_cache_entry(method, url, kwargs)
+
+        if entry is not None:
+            if entry['expires'] > time.time():
+                self._local.response = None
+                return self.process_cache_entry(entry)
+
+            kwargs['headers'] = dict(kwargs['headers'], **entry['validators'])
+
+        for attempt in itertools.count():
+            try:
+                with self.limiter.limit():
+                    response = self.session.request(method, url, **kwargs)
+            except self.retry_exceptions:
+                delay = self.get_retry_delay(method, attempt)
+
+                if delay is None:
+                    raise
+            else:
+                delay = self.get_retry_delay(method, attempt, response)
+
+                if delay is None:
+                    break
+
+                response.close()
+
+            time.sleep(delay)
+
+        self._local.response = response
+        self.invalidate_cache(method, url)
+
+        if key is not None:
+            return self.process_cacheable_response(key, entry, response)
+
+        return self.process_response(response)
+
+    def get_cache_entry(self, method, url, kwargs):
+        """
+        Returns cache key and cached entry for a request, key is None if request's response can't be cached.
+
+        :param string method: (required). HTTP verb of the request.
+        :param string url: (required). URL of the request.
+        :param dict kwargs: (required). Kwargs constructed for the request.
+        """
+        if self.cache is None or method.lower() != 'get' or kwargs.get('stream'):
+            return None, None
+
+        if self.ignore_response or not self.return_response or self.return_raw_response:
+            return None, None
+
+        # Credentials are a part of the key, because different users may see different data, while the group
+        # prefix allows to remove all responses cached for a URL at once
+        key = self.cache.make_key(url, kwargs['params'], kwargs['headers'], kwargs.get('auth'))
+        key = f'{self.cache_group(url)}.{key}'
+        return key, self.cache.get(key)
+
+    def cache_group(self, url):
+        """
+        Returns a group of cache keys for a URL, which is the same for all query strings of the URL.
+
+        :param string url: (required). URL of the request.
+        """
+        return self.cache.make_key(urllib.parse.urlsplit(url)._replace(query='', fragment='').geturl())[:16]
+
+    def invalidate_cache(self, method, url):
+        """
+        Removes cached responses which may become outdated after a request which changes data in Redmine, i.e.
+        responses for the URL of the request and for its collection, e.g. for /issues/1.json and /issues.json.
+
+        :param string method: (required). HTTP verb of the request.
+        :param string url: (required). URL of the request.
+        """
+        if self.cache is None or method.lower() in ('get', 'head', 'options'):
+            return
+
+        parts = urllib.parse.urlsplit(url)
+        head, _, tail = parts.path.rpartition('/')
+        urls = [url]
+
+        if head:
+            urls.append(parts._replace(path=head + os.path.splitext(tail)[1]).geturl())
+
+        for group_url in urls:
+            self.cache.delete_group(self.cache_group(group_url))
+
+    def process_cacheable_response(self, key, entry, response):
+        """
+        Processes response to a cacheable request and stores it in the cache. If the cached entry is still valid,
+        i.e. Redmine responded with 304 Not Modified, the entry's content is used instead.
+
+        :param string key: (required). Cache key of the request.
+        :param dict entry: (required). Cached entry, None if there is no entry in the cache.
+        :param obj response: (required). Response object with response details.
+        """
+        if entry is not None and response.status_code == 304:
+            self.cache.set(key, dict(entry, expires=time.time() + self.cache_ttl))
+            return self.process_cache_entry(entry)
+
+        result = self.process_response(response)
+
+        if response.status_code == 200:
+            validators = {}
+
+            if response.headers.get('ETag'):
+                validators['If-None-Match'] = response.headers['ETag']
+
+            if response.headers.get('Last-Modified'):
+                validators['If-Modified-Since'] = response.headers['Last-Modified']
+
+            self.cache.set(key, {'content': response.content, 'validators': validators,
+                                 'expires': time.time() + self.cache_ttl})
+
+        return result
+
+    def process_cache_entry(self, entry):
+        """
+        Processes cached entry the same way as a response received from Redmine. Content is decoded every time,
+        so callers can modify the result without affecting the cache.
+
+        :param dict entry: (required). Cached entry.
+        """
+        if not entry['content'].strip():
+            return True
+
+        loads = json.loads if self.json_backend is None else self.json_backend.loads
+        return loads(entry['content'])
+
+    def get_retry_delay(self, method, attempt, response=None):
+        """
+        Returns how many seconds to wait before the next attempt of a request or None if it shouldn't be retried.
+
+        :param string method: (required). HTTP verb of the request.
+        :param int attempt: (required). Number of the failed attempt starting from zero.
+        :param obj response: (optional). Response object with response details, None in case of a connection error.
+        """
+        if self.retry is None:
+            return None
+
+        if response is None:
+            return self.retry.get_delay(method, attempt)
+
+        if response.status_code not in self.retry.statuses:
+            return None
+
+        return self.retry.get_delay(method, attempt, response.status_code, response.headers.get('Retry-After'))
+
+    def timed_request(self, method, url, container, **params):
+        """
+        Makes a single request for a page of resources and adapts chunk size to the response, returns processed
+        response and a chunk size that should be used for the next requests.
+
+        :param string method: (required). HTTP verb to use for the request.
+        :param string url: (required). URL of the request.
+        :param string container: (required). Key in the response that should be used to access retrieved resources.
+        :param dict params: (optional). Params that should be used for resource retrieval.
+        """
+        started = time.monotonic()
+        response = self.request(method, url, params=params)
+        return response, self.adapt_to_response(
+            response, self._local.response, container, params['limit'], time.monotonic() - started)
+
+    def adapt_to_response(self, response, raw_response, container, limit, elapsed):
+        """
+        Adapts chunk size to a response to a single request for a page of resources and returns a chunk size
+        that should be used for the next requests.
+
+        :param dict response: (required). Processed response.
+        :param obj raw_response: (required). Response object, None if response was taken from the cache.
+        :param string container: (required). Key in the response that should be used to access retrieved resources.
+        :param int limit: (required). Limit that was used for the request.
+        :param float elapsed: (required). How many seconds it took to receive and process the response.
+        """
+        # There is no response to adapt to if it was taken from the cache
+        if self.min_chunk < self.max_chunk and isinstance(response.get('limit'), int) and raw_response is not None:
+            # Redmine silently decreases limit to its per page maximum, so we can discover it
+            if response['limit'] < limit:
+                self.server_chunk = response['limit']
+            # Otherwise Redmine's maximum is at least the maximum chunk size that was requested to discover it
+            elif self.server_chunk is None and limit >= self.max_chunk:
+                self.server_chunk = limit
+
+            self.chunk = self.adapt_chunk(len(response[container]), elapsed, len(raw_response.content))
+
+        return min(self.chunk, self.server_chunk or self.chunk)
+
+    def adapt_chunk(self, resources, elapsed, size):
+        """
+        Calculates chunk size so that each request takes about chunk_time seconds and its response is not
+        bigger than chunk_bytes bytes, growth is limited to twice the current chunk size at once.
+
+        :param int resources: (required). Amount of resources in the response.
+        :param float elapsed: (required). How many seconds it took to receive and process the response.
+        :param int size: (required). Size of the response in bytes.
+        """
+        if not resources:
+            return self.chunk
+
+        chunk = self.chunk * 2
+
+        if elapsed > 0:
+            chunk = min(chunk, resources * self.chunk_time / elapsed)
+
+        if self.chunk_bytes and size:
+            chunk = min(chunk, resources * self.chunk_bytes / size)
+
+        return max(self.min_chunk, min(self.max_chunk, self.server_chunk or self.max_chunk, int(chunk)))
 
     def bulk_request(self, method, url, container, **params):
         """
@@ -93,34 +381,175 @@ class BaseEngine:
         """
         limit = params.get('limit') or 0
         offset = params.get('offset') or 0
-        response = self.request(method, url, params=dict(params, limit=limit or self.chunk, offset=offset))
+        response, chunk = self.timed_request(
+            method, url, container, **dict(params, limit=limit or self.first_chunk, offset=offset))
+        results, total_count, bulk_params = self.split_bulk_request(response, container, chunk, **params)
+
+        # If we need to make just one more request, there's no point in async
+        if len(bulk_params) == 1:
+            results.extend(self.request(method, url, params=bulk_params[0])[container])
+        elif bulk_params:
+            results.extend(self.process_bulk_request(method, url, container, bulk_params))
+
+        return results, total_count
+
+    def multi_request(self, method, requests, workers=None):
+        """
+        Makes many independent requests to Redmine and returns processed responses in the order of requests.
+
+        :param string method: (required). HTTP verb to use for the requests.
+        :param list requests: (required). Pairs of URL and params of each request.
+        :param int workers: (optional). How many requests can be made at the same time, one by one if not set.
+        """
+        return self.concurrent_map(lambda request: self.request(method, request[0], params=request[1]), requests,
+                                   workers)
+
+    def concurrent_map(self, function, items, workers=None):
+        """
+        Calls a function, which usually makes requests to Redmine, for each item and returns results in the order
+        of items.
+
+        :param function: (required). Function which accepts a single item.
+        :param list items: (required). Items to call the function with.
+        :param int workers: (optional). How many calls can be made at the same time, one by one if not set.
+        """
+        if not workers or workers < 2 or len(items) < 2:
+            return [function(item) for item in items]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(workers, len(items))) as executor:
+            return list(executor.map(function, items))
+
+    def split_bulk_request(self, response, container, chunk, **params):
+        """
+        Processes the first response of a bulk request and splits the rest of it into params for each of the
+        requests that still have to be made. Returns resources from the first response, total count of resources
+        and a list of params.
+
+        :param any response: (required). Response received from Redmine for the first request.
+        :param string container: (required). Key in the response that should be used to access retrieved resources.
+        :param int chunk: (required). How many resources to request at once.
+        :param dict params: (optional). Params that should be used for resource retrieval.
+        """
+        limit = params.get('limit') or 0
+        offset = params.get('offset') or 0
+        bulk_params = []
 
         # Resource supports limit/offset on Redmine level
         if all(response.get(param) is not None for param in ('total_count', 'limit', 'offset')):
             total_count = response['total_count']
             results = response[container]
-            limit = limit or total_count
-
-            if limit > self.chunk:
-                bulk_params = []
+            end = min(offset + limit, total_count) if limit else total_count
 
-                for num in range(limit - self.chunk, 0, -self.chunk):
-                    offset += self.chunk
-                    limit -= self.chunk
-                    bulk_params.append(dict(params, offset=offset, limit=limit))
+            # Redmine may return less resources than requested if chunk exceeds its per page limit,
+            # that is why its actual limit is used to calculate offsets of the next requests
+            chunk = min(chunk, response['limit'] or chunk)
 
-                # If we need to make just one more request, there's no point in async
-                if len(bulk_params) == 1:
-                    results.extend(self.request(method, url, params=bulk_params[0])[container])
-                else:
-                    results.extend(self.process_bulk_request(method, url, container, bulk_params))
+            for num in range(offset + len(results), end, chunk):
+                bulk_params.append(dict(params, offset=num, limit=min(chunk, end - num)))
         # We have to mimic limit/offset if a resource
         # doesn't support this feature on Redmine level
         else:
             total_count = len(response[container])
             results = response[container][offset:None if limit == 0 else limit + offset]
 
-        return results, total_count
+        return results, total_count, bulk_params
+
+    def iter_bulk_request(self, method, url, container, chunk=None, prefetch=None, **params):
+        """
+        Makes requests lazily one by one, i.e. the next request is made only after the resources from the previous
+        one were consumed, and yields a tuple with resources and total count of resources for each response. If
+        prefetch is set, up to this amount of next requests are made in background while resources are consumed.
+
+        :param string method: (required). HTTP verb to use for the request.
+        :param string url: (required). URL of the request.
+        :param string container: (required). Key in the response that should be used to access retrieved resources.
+        :param int chunk: (optional). How many resources to request at once, adapted by engine if not set.
+        :param int prefetch: (optional). How many requests to make ahead, engine's prefetch is used if not set.
+        :param dict params: (optional). Params that should be used for resource retrieval.
+        """
+        prefetch = self.prefetch if prefetch is None else prefetch
+        limit = params.get('limit') or 0
+        offset = params.get('offset') or 0
+        page_chunk = chunk or self.first_chunk
+        response, next_chunk = self.timed_request(
+            method, url, container, **dict(params, limit=min(limit or page_chunk, page_chunk), offset=offset))
+
+        # We have to mimic limit/offset if a resource
+        # doesn't support this feature on Redmine level
+        if not all(response.get(param) is not None for param in ('total_count', 'limit', 'offset')):
+            yield response[container][offset:None if limit == 0 else limit + offset], len(response[container])
+            return
+
+        total_count = response['total_count']
+
+        if prefetch:
+            resources, total_count, bulk_params = self.split_bulk_request(
+                response, container, chunk or next_chunk, **params)
+            yield resources, total_count
+
+            for resources in self.process_prefetch_request(method, url, container, bulk_params, prefetch):
+                yield resources, total_count
+
+            return
+
+        end = min(offset + limit, total_count) if limit else total_count
+
+        while True:
+            resources = response[container]
+            offset += len(resources)
+            yield resources, total_count
+
+            # Redmine may return less resources than requested if chunk exceeds its per page limit, that is
+            # why we rely on the amount of resources that were actually received to calculate next offset
+            if not resources or offset >= end:
+                break
+
+            page_chunk = chunk or next_chunk
+            response, next_chunk = self.timed_request(
+                method, url, container, **dict(params, limit=min(end - offset, page_chunk), offset=offset))
+
+    def process_prefetch_request(self, method, url, container, bulk_params, prefetch):
+        """
+        Makes requests in background threads keeping up to prefetch requests in flight ahead of the consumer and
+        yields resources from responses in the order of bulk_params.
+
+        :param string method: (required). HTTP verb to use for the request.
+        :param string url: (required). URL of the request.
+        :param string container: (required). Key in the response that should be used to access retrieved resources.
+        :param iterable bulk_params: (required). Params that should be used for resource retrieval.
+        :param int prefetch: (required). How many requests to make ahead.
+        """
+        bulk_params = iter(bulk_params)
+        futures = collections.deque()
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=prefetch)
+
+        try:
+            for params in itertools.islice(bulk_params, prefetch):
+                futures.append(executor.submit(self.request, method, url, params=params))
+
+            while futures:
+                response = futures.popleft().result()
+
+                for params in itertools.islice(bulk_params, 1):
+                    futures.append(executor.submit(self.request, method, url, params=params))
+
+                yield response[container]
+        finally:
+            for future in futures:
+                future.cancel()
+
+            executor.shutdown(wait=False)
+
+    @property
+    def first_chunk(self):
+        """
+        Returns chunk size for the first request of a bulk request, while Redmine's per page maximum is unknown
+        and chunk size adaptation is enabled, maximum chunk size is requested to discover it.
+        """
+        if self.min_chunk < self.max_chunk and self.server_chunk is None:
+            return self.max_chunk
+
+        return min(self.chunk, self.server_chunk or self.chunk)
 
     def process_bulk_request(self, method, url, container, bulk_params):
         """
@@ -133,6 +562,82 @@ class BaseEngine:
         """
         raise NotImplementedError
 
+    async def arequest(self, method, url, headers=None, params=None, data=None):
+        """
+        Awaitable counterpart of the request method. Blocking engines make the request in a default executor
+        of the running event loop, while truly asynchronous engines redefine this method.
+
+        :param string method: (required). HTTP verb to use for the request.
+        :param string url: (required). URL of the request.
+        :param dict headers: (optional). HTTP headers to send with the request.
+        :param dict params: (optional). Params to send in the query string.
+        :param data: (optional). Data to send in the body of the request.
+        :type data: dict, bytes or file-like object
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self.request, method, url, headers, params, data))
+
+    async def abulk_request(self, method, url, container, **params):
+        """
+        Awaitable counterpart of the bulk_request method. Blocking engines make the request in a default
+        executor of the running event loop, while truly asynchronous engines redefine this method.
+
+        :param string method: (required). HTTP verb to use for the request.
+        :param string url: (required). URL of the request.
+        :param string container: (required). Key in the response that should be used to access retrieved resources.
+        :param dict params: (optional). Params that should be used for resource retrieval.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self.bulk_request, method, url, container, **params))
+
+    async def amulti_request(self, method, requests, workers=None):
+        """
+        Awaitable counterpart of the multi_request method.
+
+        :param string method: (required). HTTP verb to use for the requests.
+        :param list requests: (required). Pairs of URL and params of each request.
+        :param int workers: (optional). How many requests can be made at the same time, one by one if not set.
+        """
+        return await self.aconcurrent_map(lambda request: self.arequest(method, request[0], params=request[1]),
+                                          requests, workers)
+
+    async def aconcurrent_map(self, function, items, workers=None):
+        """
+        Awaitable counterpart of the concurrent_map method, function should return an awaitable.
+
+        :param function: (required). Function which accepts a single item.
+        :param list items: (required). Items to call the function with.
+        :param int workers: (optional). How many calls can be made at the same time, one by one if not set.
+        """
+        semaphore = asyncio.Semaphore(workers or 1)
+
+        async def call(item):
+            async with semaphore:
+                return await function(item)
+
+        # gather() returns results in the order of items
+        return list(await asyncio.gather(*(call(item) for item in items)))
+
+    def __getstate__(self):
+        # Thread local storage can't be pickled, so a new one will be created after unpickling
+        return {key: value for key, value in self.__dict__.items() if key != '_local'}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def decode_response(self, response):
+        """
+        Decodes JSON response received from Redmine. If JSON backend is set, it decodes response's raw bytes
+        directly, otherwise response object decodes itself.
+
+        :param obj response: (required). Response object with response details.
+        """
+        if self.json_backend is None:
+            return response.json()
+
+        return self.json_backend.loads(response.content)
+
     def process_response(self, response):
         """
         Processes response received from Redmine.
@@ -167,7 +672,7 @@ class BaseEngine:
                 return True
             else:
                 try:
-                    return response.json()
+                    return self.decode_response(response)
                 except (ValueError, TypeError):
                     raise exceptions.JSONDecodeError(response)
         elif status_code == 401:
@@ -183,7 +688,7 @@ class BaseEngine:
         elif status_code == 413:
             raise exceptions.RequestEntityTooLargeError
         elif status_code == 422:
-            errors = response.json()['errors']
+            errors = self.decode_response(response)['errors']
             raise exceptions.ValidationError(', '.join(': '.join(e) if isinstance(e, list) else e for e in errors))
         elif status_code == 500:
             raise exceptions.ServerError
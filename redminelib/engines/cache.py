@@ -0,0 +1,160 @@
+"""
+Defines cache backends which are used by engines to store responses to GET requests.
+"""
+
+import os
+import json
+import base64
+import hashlib
+import tempfile
+import threading
+import collections
+
+
+class BaseCache:
+    def get(self, key):
+        """
+        Returns a cached entry or None if there is no entry for the key.
+
+        :param string key: (required). Key of the entry.
+        """
+        raise NotImplementedError
+
+    def set(self, key, entry):
+        """
+        Stores an entry in the cache.
+
+        :param string key: (required). Key of the entry.
+        :param dict entry: (required). Entry which consists of response content, validators and expiration time.
+        """
+        raise NotImplementedError
+
+    def delete(self, key):
+        """
+        Removes an entry from the cache if it exists.
+
+        :param string key: (required). Key of the entry.
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """
+        Removes all entries from the cache.
+        """
+        raise NotImplementedError
+
+    def delete_group(self, group):
+        """
+        Removes all entries which keys start with a group prefix, e.g. all responses cached for a single URL.
+        Caches which can't find entries by a prefix remove all entries instead.
+
+        :param string group: (required). Prefix of the keys.
+        """
+        self.clear()
+
+    @staticmethod
+    def make_key(*parts):
+        """
+        Converts request details, which can't be used as a key directly, to a key.
+
+        :param parts: (required). Any JSON serializable objects.
+        """
+        return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class MemoryCache(BaseCache):
+    def __init__(self, maxsize=1000):
+        """
+        :param int maxsize: (optional). How many entries to keep, least recently used ones are removed first.
+        """
+        self.maxsize = maxsize
+        self.__setstate__({})
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._entries:
+                return None
+
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def delete_group(self, group):
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(f'{group}.')]:
+                del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getstate__(self):
+        # Lock can't be pickled and entries shouldn't be, so an empty cache is created instead
+        return {'maxsize': self.maxsize}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+
+
+class FileCache(BaseCache):
+    def __init__(self, path):
+        """
+        :param string path: (required). Path to a directory where entries will be stored, created if doesn't exist.
+        """
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def get(self, key):
+        try:
+            with open(os.path.join(self.path, key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        return dict(entry, content=base64.b64decode(entry['content']))
+
+    def set(self, key, entry):
+        entry = dict(entry, content=base64.b64encode(entry['content']).decode('ascii'))
+
+        # Entry is written to a temporary file first, so other processes never see a partially written entry
+        fd, path = tempfile.mkstemp(dir=self.path, prefix='.')
+
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+
+            os.replace(path, os.path.join(self.path, key))
+        except OSError:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def delete(self, key):
+        try:
+            os.remove(os.path.join(self.path, key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        for name in os.listdir(self.path):
+            self.delete(name)
+
+    def delete_group(self, group):
+        for name in os.listdir(self.path):
+            if name.startswith(f'{group}.'):
+                self.delete(name)
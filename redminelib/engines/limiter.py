@@ -0,0 +1,105 @@
+"""
+Defines rate limiter which is used by engines to avoid overloading Redmine with too many requests.
+"""
+
+import time
+import asyncio
+import threading
+import contextlib
+
+
+class RateLimiter:
+    def __init__(self, rate=None, burst=None, max_in_flight=None):
+        """
+        :param float rate: (optional). How many requests per second can be made on average, unlimited if not set.
+        :param int burst: (optional). How many requests can be made at once after a period of inactivity.
+        :param int max_in_flight: (optional). How many requests can be processed by Redmine at the same time.
+        """
+        self.rate = rate
+        self.burst = burst or 1
+        self.max_in_flight = max_in_flight
+        self.__setstate__({})
+
+    def reserve(self):
+        """
+        Takes a token from the bucket and returns how many seconds to wait before it can be used.
+        Tokens are reserved ahead, so concurrent callers are spread evenly instead of competing.
+        """
+        if not self.rate:
+            return 0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate) - 1
+            self._updated = now
+            return max(-self._tokens / self.rate, 0)
+
+    @contextlib.contextmanager
+    def limit(self):
+        """
+        Blocks the current thread until a request can be made within the limits.
+        """
+        if self.max_in_flight:
+            self._semaphore.acquire()
+
+        try:
+            delay = self.reserve()
+
+            if delay:
+                time.sleep(delay)
+
+            yield
+        finally:
+            if self.max_in_flight:
+                self._semaphore.release()
+
+    @contextlib.asynccontextmanager
+    async def alimit(self):
+        """
+        Suspends the current task until a request can be made within the limits. Requests in flight are counted
+        separately for each event loop, because asyncio primitives can't be shared between them.
+        """
+        semaphore = self.async_semaphore
+
+        if semaphore is not None:
+            await semaphore.acquire()
+
+        try:
+            delay = self.reserve()
+
+            if delay:
+                await asyncio.sleep(delay)
+
+            yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    @property
+    def async_semaphore(self):
+        """
+        Returns a semaphore bound to the running event loop, a new one is created for each new loop.
+        """
+        if not self.max_in_flight:
+            return None
+
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            if self._async_semaphore_loop is not loop:
+                self._async_semaphore = asyncio.Semaphore(self.max_in_flight)
+                self._async_semaphore_loop = loop
+
+            return self._async_semaphore
+
+    def __getstate__(self):
+        # Locks and semaphores can't be pickled, so they are recreated in a fresh state
+        return {'rate': self.rate, 'burst': self.burst, 'max_in_flight': self.max_in_flight}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._semaphore = threading.BoundedSemaphore(self.max_in_flight) if self.max_in_flight else None
+        self._async_semaphore = self._async_semaphore_loop = None
@@ -0,0 +1,81 @@
+"""
+Defines retry policy which is used by engines to repeat requests that failed due to transient errors.
+"""
+
+import random
+import datetime
+import email.utils
+
+
+class Retry:
+    def __init__(self, total=3, backoff_factor=0.5, backoff_max=60, jitter=0.5,
+                 statuses=(429, 500, 502, 503, 504), methods=('get', 'head', 'options'),
+                 respect_retry_after=True):
+        """
+        :param int total: (optional). How many times a single request can be retried.
+        :param float backoff_factor: (optional). Delay before the first retry, doubled before each next retry.
+        :param float backoff_max: (optional). Maximum delay between retries in seconds.
+        :param float jitter: (optional). Fraction of a delay that is randomized to spread retries of many clients.
+        :param statuses: (optional). HTTP status codes which should be retried.
+        :type statuses: list or tuple
+        :param methods: (optional). HTTP verbs which should be retried, only verbs that don't change data by
+         default, because e.g. PUT with notes adds a new journal each time it's repeated.
+        :type methods: list or tuple
+        :param bool respect_retry_after: (optional). Whether to wait as long as Retry-After response header asks.
+        """
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.statuses = statuses
+        self.methods = methods
+        self.respect_retry_after = respect_retry_after
+
+    def get_delay(self, method, attempt, status_code=None, retry_after=None):
+        """
+        Returns how many seconds to wait before the next attempt or None if request shouldn't be retried.
+
+        :param string method: (required). HTTP verb of the request.
+        :param int attempt: (required). Number of the failed attempt starting from zero.
+        :param int status_code: (optional). HTTP status code of the response, None in case of a connection error.
+        :param string retry_after: (optional). Value of the Retry-After response header.
+        """
+        if attempt >= self.total or method.lower() not in self.methods:
+            return None
+
+        if status_code is not None and status_code not in self.statuses:
+            return None
+
+        if retry_after is not None and self.respect_retry_after:
+            delay = self.parse_retry_after(retry_after)
+
+            if delay is not None:
+                return min(delay, self.backoff_max)
+
+        delay = min(self.backoff_factor * 2 ** attempt, self.backoff_max)
+        return delay - random.uniform(0, delay * self.jitter)
+
+    @staticmethod
+    def parse_retry_after(value):
+        """
+        Converts value of the Retry-After header, which is either seconds or HTTP date, to seconds.
+
+        :param string value: (required). Value of the Retry-After response header.
+        """
+        try:
+            return max(float(value), 0)
+        except (TypeError, ValueError):
+            pass
+
+        try:
+            date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+
+        if date is None:
+            return None
+
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=datetime.timezone.utc)
+
+        return max((date - datetime.datetime.now(datetime.timezone.utc)).total_seconds(), 0)
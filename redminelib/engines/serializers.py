@@ -0,0 +1,68 @@
+"""
+Defines JSON backends which are used by engines to decode responses and encode requests.
+Third-party backends are much faster than the standard library, so they are used if installed.
+"""
+
+import json
+import importlib
+
+from .. import exceptions
+
+
+class JSONBackend:
+    def __init__(self, name, loads, dumps):
+        """
+        :param string name: (required). Name of the backend.
+        :param callable loads: (required). Function that decodes JSON from bytes.
+        :param callable dumps: (required). Function that encodes data to JSON string or bytes.
+        """
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} "{self.name}">'
+
+
+def _orjson(module):
+    return JSONBackend('orjson', module.loads, module.dumps)
+
+
+def _ujson(module):
+    return JSONBackend('ujson', module.loads, module.dumps)
+
+
+def _simdjson(module):
+    # simdjson can only decode JSON, standard library is used for encoding
+    return JSONBackend('simdjson', module.loads, json.dumps)
+
+
+def _json(module):
+    return JSONBackend('json', module.loads, module.dumps)
+
+
+BACKENDS = {'orjson': _orjson, 'ujson': _ujson, 'simdjson': _simdjson, 'json': _json}
+
+
+def get_json_backend(name):
+    """
+    Returns JSON backend by its name, auto selects the fastest installed backend.
+
+    :param string name: (required). Name of the backend, i.e. auto, orjson, ujson, simdjson or json.
+    """
+    if name == 'auto':
+        for name in BACKENDS:
+            try:
+                return get_json_backend(name)
+            except exceptions.JSONBackendError:
+                continue
+
+    if name not in BACKENDS:
+        raise exceptions.JSONBackendError(name)
+
+    try:
+        module = importlib.import_module(name)
+    except ImportError:
+        raise exceptions.JSONBackendError(name) from None
+
+    return BACKENDS[name](module)
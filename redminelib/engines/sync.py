@@ -8,9 +8,21 @@ from . import BaseEngine
 
 
 class SyncEngine(BaseEngine):
-    @staticmethod
-    def create_session(**params):
-        return requests.Session()
+    retry_exceptions = (requests.ConnectionError, requests.Timeout)
+
+    def create_session(self, **params):
+        session = requests.Session()
+        adapter = self.create_adapter()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def create_adapter(self):
+        """
+        Creates a transport adapter with a connection pool which is shared by all requests made by the session.
+        """
+        return requests.adapters.HTTPAdapter(
+            pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize, pool_block=self.pool_block)
 
     def process_bulk_request(self, method, url, container, bulk_params):
         return [resource for params in bulk_params for resource in self.request(method, url, params=params)[container]]
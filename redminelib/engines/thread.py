@@ -0,0 +1,27 @@
+"""
+Asynchronous engine that processes bulk requests concurrently using a pool of Python threads.
+"""
+
+import os
+import concurrent.futures
+
+from . import SyncEngine
+
+
+class ThreadEngine(SyncEngine):
+    def __init__(self, **options):
+        """
+        :param int workers: (optional). How many threads to use, calculated automatically if not set.
+        :param int pool_maxsize: (optional). Maximum number of pooled connections per host, equals workers if not set.
+        """
+        self.workers = options.pop('workers', None) or min(32, (os.cpu_count() or 1) + 4)
+        super().__init__(**dict(options, pool_maxsize=options.get('pool_maxsize') or self.workers))
+
+    def process_bulk_request(self, method, url, container, bulk_params):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.workers, len(bulk_params))) as executor:
+            # map() yields results in the order of bulk_params, so resources are kept in offset order
+            pages = executor.map(lambda params: self.request(method, url, params=params)[container], bulk_params)
+            return [resource for page in pages for resource in page]
+
+    def concurrent_map(self, function, items, workers=None):
+        return super().concurrent_map(function, items, workers or self.workers)
@@ -128,6 +128,14 @@ class ResourceSetFilterLookupError(BaseRedmineError):
         super().__init__(f'Received an invalid lookup "{lookup}" in "{f}" filter')
 
 
+class ResourceSetPrefetchError(BaseRedmineError):
+    """
+    Resource set prefetch method received an include which isn't supported by resource.
+    """
+    def __init__(self, include):
+        super().__init__(f"Resource doesn't support {include} include or can't be retrieved by id")
+
+
 class ResourceBadMethodError(BaseRedmineError):
     """
     Resource doesn't support the requested method.
@@ -300,3 +308,11 @@ class EngineClassError(BaseRedmineError):
     """
     def __init__(self):
         super().__init__("Engine isn't a class or isn't a BaseEngine subclass")
+
+
+class JSONBackendError(BaseRedmineError):
+    """
+    JSON backend isn't supported or isn't installed.
+    """
+    def __init__(self, name):
+        super().__init__(f"JSON backend {name} isn't supported or isn't installed")
@@ -2,29 +2,259 @@
 Defines lookup classes to be used in ResultSet's filter method.
 """
 
+import datetime
+import operator
+import functools
+
+from . import exceptions
+
 registry = {}
 
 
+def to_raw(value):
+    """
+    Converts dates and datetimes to strings in the format they are returned by Redmine, so that they can be
+    compared with resources data directly, other values are returned as is.
+
+    :param any value: (required). Value requested in a lookup.
+    """
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc)
+
+        return value.strftime('%Y-%m-%dT%H:%M:%SZ')
+    elif isinstance(value, datetime.date):
+        return value.isoformat()
+
+    return value
+
+
+def parse(filter_name):
+    """
+    Splits a filter name into a fields path and a lookup, exact lookup is used if there is no lookup in the name.
+
+    :param string filter_name: (required). Filter name, e.g. status__id__in.
+    """
+    fields = filter_name.split('__')
+
+    if fields[-1] in registry:
+        return fields[:-1], registry[fields[-1]]
+
+    return fields, registry['exact']
+
+
+def getter(fields):
+    """
+    Returns a function which gets a value by fields path from resource data using a chain of item getters.
+
+    :param fields: (required). Path to the value in resource data.
+    :type fields: list or tuple
+    """
+    getters = [operator.itemgetter(field) for field in fields]
+
+    if not getters:
+        return lambda resource: resource
+    elif len(getters) == 1:
+        return getters[0]
+    elif len(getters) == 2:
+        first, second = getters
+        return lambda resource: second(first(resource))
+
+    return lambda resource: functools.reduce(lambda value, get: get(value), getters, resource)
+
+
+def compile_filters(reducers):
+    """
+    Compiles reducers into a single predicate which checks whether resource data satisfies all of them, paths
+    and requested values are processed only once instead of doing that for each resource.
+
+    :param list reducers: (required). Reducers with fields, value, lookup, lookup_name and filter_name keys.
+    """
+    checks = []
+
+    for r in reducers:
+        try:
+            check = r['lookup'].prepare(r['value'])
+        except (TypeError, ValueError, AttributeError):
+            raise exceptions.ResourceSetFilterLookupError(r['lookup_name'], r['filter_name'])
+
+        checks.append((getter(r['fields']), check, r['lookup'].missing_is_null, r))
+
+    def predicate(resource):
+        for get, check, missing_is_null, r in checks:
+            try:
+                if not check(get(resource)):
+                    return False
+            except KeyError:
+                if not missing_is_null or not check(None):
+                    return False
+            except TypeError:
+                raise exceptions.ResourceSetFilterLookupError(r['lookup_name'], r['filter_name'])
+
+        return True
+
+    return predicate
+
+
 class Lookup:
     lookup_name = None
+    pushdown_kind = None  # Kind of Redmine filters the lookup can be translated to, i.e. id or date
+    missing_is_null = False  # Whether a missing value should be checked as None instead of failing the lookup
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
-        registry[cls.lookup_name] = cls()
+
+        if cls.lookup_name is not None:  # base classes of lookups shouldn't be added to the registry
+            registry[cls.lookup_name] = cls()
 
     def __call__(self, resource_value, requested_value):
         raise NotImplementedError
 
+    def prepare(self, requested_value):
+        """
+        Returns a function which checks a single resource value against the requested value.
+
+        :param any requested_value: (required). Value requested in the lookup.
+        """
+        return lambda resource_value: self(resource_value, requested_value)
+
+    def pushdown(self, requested_value, separator):
+        """
+        Returns value of a Redmine filter which selects the same resources as the lookup or None if there isn't one.
+
+        :param any requested_value: (required). Value requested in the lookup.
+        :param string separator: (required). Separator of many values supported by the filter.
+        """
+        return None
+
 
 class Exact(Lookup):
     lookup_name = 'exact'
+    pushdown_kind = 'id'
 
     def __call__(self, resource_value, requested_value):
         return resource_value == requested_value
 
+    def pushdown(self, requested_value, separator):
+        # Redmine filters compare ids as integers, while other types may not be equal to them in Python
+        if type(requested_value) is int:
+            return str(requested_value)
+
+        return None
+
 
 class In(Lookup):
     lookup_name = 'in'
+    pushdown_kind = 'id'
 
     def __call__(self, resource_value, requested_values):
         return resource_value in requested_values
+
+    def pushdown(self, requested_values, separator):
+        if not isinstance(requested_values, (list, tuple, set, frozenset)) or not requested_values:
+            return None
+
+        if all(type(value) is int for value in requested_values):
+            return separator.join(str(value) for value in requested_values)
+
+        return None
+
+
+class Comparison(Lookup):
+    operator = None
+    redmine_operator = None  # Operator of Redmine filters which selects the same resources, if there is one
+
+    def __call__(self, resource_value, requested_value):
+        return self.prepare(requested_value)(resource_value)
+
+    def prepare(self, requested_value):
+        requested_value = to_raw(requested_value)
+        # Empty values, e.g. an issue without a due date, never match, like in SQL
+        return lambda resource_value: resource_value is not None and self.operator(resource_value, requested_value)
+
+    def pushdown(self, requested_value, separator):
+        # Only dates can be translated because Redmine interprets datetimes in the timezone of a user
+        if self.redmine_operator is not None and type(requested_value) is datetime.date:
+            return f'{self.redmine_operator}{requested_value.isoformat()}'
+
+        return None
+
+
+class Gt(Comparison):
+    lookup_name = 'gt'
+    operator = operator.gt
+
+
+class Gte(Comparison):
+    lookup_name = 'gte'
+    pushdown_kind = 'date'
+    operator = operator.ge
+    redmine_operator = '>='
+
+
+class Lt(Comparison):
+    lookup_name = 'lt'
+    operator = operator.lt
+
+
+class Lte(Comparison):
+    lookup_name = 'lte'
+    pushdown_kind = 'date'
+    operator = operator.le
+    redmine_operator = '<='
+
+
+class Range(Lookup):
+    lookup_name = 'range'
+    pushdown_kind = 'date'
+
+    def __call__(self, resource_value, requested_values):
+        return self.prepare(requested_values)(resource_value)
+
+    def prepare(self, requested_values):
+        start, end = (to_raw(value) for value in requested_values)
+        return lambda resource_value: resource_value is not None and start <= resource_value <= end
+
+    def pushdown(self, requested_values, separator):
+        try:
+            start, end = requested_values
+        except (TypeError, ValueError):
+            return None
+
+        if type(start) is datetime.date and type(end) is datetime.date:
+            return f'><{start.isoformat()}{separator}{end.isoformat()}'
+
+        return None
+
+
+class Contains(Lookup):
+    lookup_name = 'contains'
+
+    def __call__(self, resource_value, requested_value):
+        return resource_value is not None and requested_value in resource_value
+
+
+class IContains(Lookup):
+    lookup_name = 'icontains'
+
+    def __call__(self, resource_value, requested_value):
+        return self.prepare(requested_value)(resource_value)
+
+    def prepare(self, requested_value):
+        requested_value = requested_value.lower()
+        return lambda resource_value: resource_value is not None and requested_value in str.lower(resource_value)
+
+
+class StartsWith(Lookup):
+    lookup_name = 'startswith'
+
+    def __call__(self, resource_value, requested_value):
+        return resource_value is not None and str.startswith(resource_value, requested_value)
+
+
+class IsNull(Lookup):
+    lookup_name = 'isnull'
+    missing_is_null = True
+
+    def __call__(self, resource_value, requested_value):
+        return (resource_value is None) == requested_value
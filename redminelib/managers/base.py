@@ -19,6 +19,8 @@ class ResourceManager:
         self.container = None
         self.redmine = redmine
         self.resource_class = resource_class
+        self.identity_map = redmine.identity_map
+        self._nested_managers = {}
 
     def to_resource(self, resource):
         """
@@ -28,6 +30,28 @@ class ResourceManager:
         """
         return self.resource_class(self, resource)
 
+    def to_shared_resource(self, resource):
+        """
+        Converts resource data to Resource object, which is shared with all other resources with the same id
+        if identity map is enabled.
+
+        :param dict resource: (required). Resource data.
+        """
+        if self.identity_map is None:
+            return self.to_resource(resource)
+
+        try:
+            key = (self.resource_class, resource[self.resource_class.internal_id_key])
+        except (KeyError, TypeError):
+            return self.to_resource(resource)
+
+        shared = self.identity_map.get(key)
+
+        if shared is None:
+            shared = self.identity_map[key] = self.to_resource(resource)
+
+        return shared
+
     def to_resource_set(self, resources):
         """
         Converts an iterable with resources data to ResourceSet object.
@@ -54,6 +78,22 @@ class ResourceManager:
         manager.params = params
         return manager
 
+    def nested_manager(self, resource_name):
+        """
+        Returns ResourceManager object which is shared by all resources nested into resources of this manager,
+        e.g. by projects of all issues, so that a new manager isn't created for every nested resource.
+
+        :param string resource_name: (required). Resource name.
+        """
+        manager = self._nested_managers.get(resource_name)
+
+        if manager is None:
+            manager = self._nested_managers[resource_name] = self.new_manager(resource_name)
+
+        # Identity map may be changed after a nested manager was created, i.e. by a ResourceSet
+        manager.identity_map = self.identity_map
+        return manager
+
     def _construct_get_url(self, path):
         """
         Constructs URL for get method.
@@ -70,6 +110,22 @@ class ResourceManager:
         """
         return self.resource_class.bulk_decode(request, self)
 
+    def _init_get_request(self, resource_id, params):
+        """
+        Validates and constructs URL, params and container for get method.
+
+        :param resource_id: (required). Resource id.
+        :type resource_id: int or string
+        :param dict params: (required). Parameters used for resource retrieval.
+        """
+        try:
+            self.url = self._construct_get_url(self.resource_class.query_one.format(resource_id, **params))
+        except KeyError as e:
+            raise exceptions.ValidationError(f'{e} argument is required')
+
+        self.params = self._prepare_get_request(params)
+        self.container = self.resource_class.container_one
+
     def get(self, resource_id, **params):
         """
         Returns a Resource object from Redmine by resource id.
@@ -87,16 +143,38 @@ class ResourceManager:
 
             return resource
 
+        self._init_get_request(resource_id, params)
+
         try:
-            self.url = self._construct_get_url(self.resource_class.query_one.format(resource_id, **params))
-        except KeyError as e:
-            raise exceptions.ValidationError(f'{e} argument is required')
+            response = self.redmine.engine.request('get', self.url, params=self.params)
+        except exceptions.ResourceNotFoundError as e:
+            if self.resource_class.requirements:
+                raise exceptions.ResourceRequirementsError(self.resource_class.requirements)
+            raise e
 
-        self.params = self._prepare_get_request(params)
-        self.container = self.resource_class.container_one
+        return self._process_get_response(self.params, response)
+
+    async def aget(self, resource_id, **params):
+        """
+        Awaitable counterpart of the get method.
+
+        :param resource_id: (required). Resource id.
+        :type resource_id: int or string
+        :param dict params: (optional). Parameters used for resource retrieval.
+        """
+        if self.resource_class.query_one is None or self.resource_class.container_one is None:
+            operation = self.aall if self.resource_class.query_all else self.afilter
+            resource = (await operation(**params)).get(resource_id, None)
+
+            if resource is None:
+                raise exceptions.ResourceNotFoundError
+
+            return resource
+
+        self._init_get_request(resource_id, params)
 
         try:
-            response = self.redmine.engine.request('get', self.url, params=self.params)
+            response = await self.redmine.engine.arequest('get', self.url, params=self.params)
         except exceptions.ResourceNotFoundError as e:
             if self.resource_class.requirements:
                 raise exceptions.ResourceRequirementsError(self.resource_class.requirements)
@@ -113,6 +191,69 @@ class ResourceManager:
         """
         return self.to_resource(response[self.container])
 
+    def get_many(self, resource_ids, chunk=100, workers=None, **params):
+        """
+        Returns a ResourceSet object with Resource objects from Redmine by resource ids in the order of ids.
+        Each resource is returned once, even if several ids, e.g. identifier and id of a project, point to it.
+        Ids of resources that weren't found are available in missing_ids attribute of the ResourceSet.
+
+        :param resource_ids: (required). Resource ids.
+        :type resource_ids: list or tuple
+        :param int chunk: (optional). How many ids to request at once if Redmine can filter resources by many ids.
+        :param int workers: (optional). How many requests can be made at the same time, engine decides if not set.
+        :param dict params: (optional). Parameters used for resources retrieval.
+        """
+        unique_ids = {}
+
+        # Ids are compared as strings, because they can be passed as strings while Redmine returns integers
+        for resource_id in resource_ids:
+            unique_ids.setdefault(str(resource_id), resource_id)
+
+        resource_ids = list(unique_ids.values())
+        id_key = self.resource_class.internal_id_key
+        filter_name = f'{self.resource_class.__name__.lower()}_id'
+        separator = self.resource_class._multiple_filters.get(filter_name)
+
+        if self.resource_class.query_one is None or self.resource_class.container_one is None:
+            operation = self.all if self.resource_class.query_all else self.filter
+            found = {str(resource[id_key]): resource for resource in operation(**params).values()}
+        elif separator is not None:
+            chunks = [self.new_manager(self.resource_class.__name__).filter(**dict(params, **{
+                filter_name: separator.join(str(resource_id) for resource_id in resource_ids[i:i + chunk])}))
+                for i in range(0, len(resource_ids), chunk)]
+            found = {str(resource[id_key]): resource for resources in self.redmine.engine.concurrent_map(
+                lambda resource_set: list(resource_set.values()), chunks, workers) for resource in resources}
+        else:
+            request_params = self._prepare_get_request(params)
+
+            def get(resource_id):
+                try:
+                    url = self._construct_get_url(self.resource_class.query_one.format(resource_id, **params))
+                except KeyError as e:
+                    raise exceptions.ValidationError(f'{e} argument is required')
+
+                try:
+                    return self.redmine.engine.request('get', url, params=request_params)[
+                        self.resource_class.container_one]
+                except exceptions.ResourceNotFoundError:
+                    return None
+
+            # Resources are matched with ids by position, because they can be requested by other identifiers
+            found = {str(resource_id): resource for resource_id, resource in zip(
+                resource_ids, self.redmine.engine.concurrent_map(get, resource_ids, workers)) if resource is not None}
+
+        resources = {}
+
+        # Different ids may point to the same resource, so the first one of them decides resource's position
+        for resource_id in resource_ids:
+            if str(resource_id) in found:
+                resource = found[str(resource_id)]
+                resources.setdefault(str(resource.get(id_key, resource_id)), resource)
+
+        resource_set = resultsets.ResourceSet(self, list(resources.values()))
+        resource_set.missing_ids = [resource_id for resource_id in resource_ids if str(resource_id) not in found]
+        return resource_set
+
     def all(self, **params):
         """
         Returns a ResourceSet object with all Resource objects.
@@ -148,6 +289,22 @@ class ResourceManager:
         self.params = self.resource_class.bulk_decode(filters, self)
         return resultsets.ResourceSet(self)
 
+    async def aall(self, **params):
+        """
+        Awaitable counterpart of the all method, returns already evaluated ResourceSet object.
+
+        :param dict params: (optional). Parameters used for resources retrieval.
+        """
+        return await self.all(**params).aevaluate()
+
+    async def afilter(self, **filters):
+        """
+        Awaitable counterpart of the filter method, returns already evaluated ResourceSet object.
+
+        :param dict filters: (optional). Filters used for resources retrieval.
+        """
+        return await self.filter(**filters).aevaluate()
+
     def _construct_create_url(self, path):
         """
         Constructs URL for create method.
@@ -164,11 +321,11 @@ class ResourceManager:
         """
         return {self.container: self.resource_class.bulk_decode(request, self)}
 
-    def create(self, **fields):
+    def _init_create_request(self, fields):
         """
-        Creates a new resource in Redmine and returns created Resource object on success.
+        Validates and constructs URL and request data for create method.
 
-        :param dict fields: (optional). Fields used for resource creation.
+        :param dict fields: (required). Fields used for resource creation.
         """
         if self.resource_class.query_create is None or self.resource_class.container_create is None:
             raise exceptions.ResourceBadMethodError
@@ -183,9 +340,16 @@ class ResourceManager:
 
         self.params = self.resource_class.query_create.formatter.used_kwargs
         self.container = self.resource_class.container_create
-        request = self._prepare_create_request(self.resource_class.query_create.formatter.unused_kwargs)
-        response = self.redmine.engine.request(self.resource_class.http_method_create, url, data=request)
+        return url, self._prepare_create_request(self.resource_class.query_create.formatter.unused_kwargs)
 
+    def _finish_create_request(self, fields, request, response):
+        """
+        Constructs resource object from create response and sets URL which points to a created resource.
+
+        :param dict fields: (required). Fields used for resource creation.
+        :param dict request: (required). Original request data.
+        :param any response: (required). Response received from Redmine for this request data.
+        """
         if response is None:
             return None
 
@@ -196,6 +360,26 @@ class ResourceManager:
 
         return resource
 
+    def create(self, **fields):
+        """
+        Creates a new resource in Redmine and returns created Resource object on success.
+
+        :param dict fields: (optional). Fields used for resource creation.
+        """
+        url, request = self._init_create_request(fields)
+        response = self.redmine.engine.request(self.resource_class.http_method_create, url, data=request)
+        return self._finish_create_request(fields, request, response)
+
+    async def acreate(self, **fields):
+        """
+        Awaitable counterpart of the create method.
+
+        :param dict fields: (optional). Fields used for resource creation.
+        """
+        url, request = self._init_create_request(fields)
+        response = await self.redmine.engine.arequest(self.resource_class.http_method_create, url, data=request)
+        return self._finish_create_request(fields, request, response)
+
     def _process_create_response(self, request, response):
         """
         Processes create response and constructs resource object.
@@ -221,13 +405,13 @@ class ResourceManager:
         """
         return {self.container: self.resource_class.bulk_decode(request, self)}
 
-    def update(self, resource_id, **fields):
+    def _init_update_request(self, resource_id, fields):
         """
-        Updates a Resource object by resource id.
+        Validates and constructs URL and request data for update method.
 
         :param resource_id: (required). Resource id.
         :type resource_id: int or string
-        :param dict fields: (optional). Fields that will be updated for the resource.
+        :param dict fields: (required). Fields that will be updated for the resource.
         """
         if self.resource_class.query_update is None or self.resource_class.container_update is None:
             raise exceptions.ResourceBadMethodError
@@ -249,7 +433,17 @@ class ResourceManager:
         self.params.update(self.resource_class.query_update.formatter.used_kwargs)
         self.container = self.resource_class.container_update
         url = self._construct_update_url(query_update)
-        request = self._prepare_update_request(self.resource_class.query_update.formatter.unused_kwargs)
+        return url, self._prepare_update_request(self.resource_class.query_update.formatter.unused_kwargs)
+
+    def update(self, resource_id, **fields):
+        """
+        Updates a Resource object by resource id.
+
+        :param resource_id: (required). Resource id.
+        :type resource_id: int or string
+        :param dict fields: (optional). Fields that will be updated for the resource.
+        """
+        url, request = self._init_update_request(resource_id, fields)
         response = self.redmine.engine.request(self.resource_class.http_method_update, url, data=request)
 
         if response is None:
@@ -257,6 +451,22 @@ class ResourceManager:
 
         return self._process_update_response(request, response)
 
+    async def aupdate(self, resource_id, **fields):
+        """
+        Awaitable counterpart of the update method.
+
+        :param resource_id: (required). Resource id.
+        :type resource_id: int or string
+        :param dict fields: (optional). Fields that will be updated for the resource.
+        """
+        url, request = self._init_update_request(resource_id, fields)
+        response = await self.redmine.engine.arequest(self.resource_class.http_method_update, url, data=request)
+
+        if response is None:
+            return None
+
+        return self._process_update_response(request, response)
+
     def _process_update_response(self, request, response):
         """
         Processes update response.
@@ -282,13 +492,13 @@ class ResourceManager:
         """
         return self.resource_class.bulk_decode(request, self)
 
-    def delete(self, resource_id, **params):
+    def _init_delete_request(self, resource_id, params):
         """
-        Deletes a Resource object by resource id.
+        Validates and constructs URL and request params for delete method.
 
         :param resource_id: (required). Resource id.
         :type resource_id: int or string
-        :param dict params: (optional). Parameters used for resource deletion.
+        :param dict params: (required). Parameters used for resource deletion.
         """
         if self.resource_class.query_delete is None:
             raise exceptions.ResourceBadMethodError
@@ -298,7 +508,17 @@ class ResourceManager:
         except KeyError as e:
             raise exceptions.ValidationError(f'{e} argument is required')
 
-        request = self._prepare_delete_request(params)
+        return url, self._prepare_delete_request(params)
+
+    def delete(self, resource_id, **params):
+        """
+        Deletes a Resource object by resource id.
+
+        :param resource_id: (required). Resource id.
+        :type resource_id: int or string
+        :param dict params: (optional). Parameters used for resource deletion.
+        """
+        url, request = self._init_delete_request(resource_id, params)
         response = self.redmine.engine.request(self.resource_class.http_method_delete, url, params=request)
 
         if response is None:
@@ -306,6 +526,22 @@ class ResourceManager:
 
         return self._process_delete_response(request, response)
 
+    async def adelete(self, resource_id, **params):
+        """
+        Awaitable counterpart of the delete method.
+
+        :param resource_id: (required). Resource id.
+        :type resource_id: int or string
+        :param dict params: (optional). Parameters used for resource deletion.
+        """
+        url, request = self._init_delete_request(resource_id, params)
+        response = await self.redmine.engine.arequest(self.resource_class.http_method_delete, url, params=request)
+
+        if response is None:
+            return None
+
+        return self._process_delete_response(request, response)
+
     def _process_delete_response(self, request, response):
         """
         Processes delete response.
@@ -31,6 +31,10 @@ class IssueManager(ResourceManager):
 
         return self.create(**fields)
 
+    def get_many(self, resource_ids, chunk=100, workers=None, **params):
+        # Issues are filtered by open status by default, while closed issues should be returned as well
+        return super().get_many(resource_ids, chunk, workers, **dict({'status_id': '*'}, **params))
+
     def _prepare_create_request(self, request):
         request = super()._prepare_create_request(request)
         request.update(request[self.container].pop('_copy', {}))
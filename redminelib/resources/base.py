@@ -7,6 +7,8 @@ from datetime import date, datetime, timezone
 from .. import managers, utilities, exceptions
 
 registry = {}
+DATE_FORMAT = '%Y-%m-%d'
+DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
 
 
 class Registrar(type):
@@ -88,8 +90,8 @@ class Registrar(type):
 
         mcs.update_cls_attr(cls, '_members', properties)
 
-    @staticmethod
-    def update_cls_attr(cls, name, value):
+    @classmethod
+    def update_cls_attr(mcs, cls, name, value):
         """
         Updates class attribute's value by first copying the current value and then updating it with
         new value. We need that to be sure that each resource class has its own copy of the value.
@@ -108,6 +110,39 @@ class Registrar(type):
             return
 
         setattr(cls, name, value)
+        mcs.compile_cls_attrs(cls)
+
+    @classmethod
+    def compile_cls_attrs(mcs, cls):
+        """
+        Compiles class attributes, that are checked on every resource attribute access, into dispatch tables,
+        so that a single dict lookup is done instead of a few linear searches in lists. Tables have to be
+        recompiled each time the attributes are changed, subclasses are recompiled too as they may inherit them.
+
+        :param any cls: (required). Resource class.
+        """
+        # Later updates take precedence, so the order is reversed to the order of checks in encode()
+        encoders = {'parent': ('resource', cls.__name__)}
+        encoders.update((attr, ('resource_set', name)) for attr, name in cls._resource_set_map.items())
+        encoders.update((attr, ('resource', name)) for attr, name in cls._resource_map.items())
+        encoders.update((attr, ('unconvertible', None)) for attr in cls._unconvertible)
+        cls._encoders = encoders
+
+        getters = dict.fromkeys(cls._includes, 'include')
+        getters.update(dict.fromkeys(cls._relations, 'relation'))
+        cls._getters = getters
+
+        cls._custom_settable = frozenset([*cls._single_attr_id_map, *cls._multiple_attr_id_map])
+        cls._settable = frozenset(cls._members) - cls._custom_settable
+
+        # Relations and includes can't be set and are shown as resource attributes even if they weren't retrieved
+        relations_includes = [*cls._relations, *cls._includes]
+        cls._create_readonly_attrs = frozenset([*cls._create_readonly, *relations_includes])
+        cls._update_readonly_attrs = frozenset([*cls._update_readonly, *relations_includes])
+        cls._default_attrs = dict.fromkeys(relations_includes)
+
+        for subclass in cls.__subclasses__():
+            mcs.compile_cls_attrs(subclass)
 
 
 class BaseResource(metaclass=Registrar):
@@ -143,6 +178,10 @@ class BaseResource(metaclass=Registrar):
     _includes_map = {}
     _relations = []
     _relations_name = None
+    _relations_name_map = {}  # Relations that should be filtered by another name than _relations_name
+    _multiple_filters = {}  # Filters that accept many values at once, maps them to the values separator
+    _date_filters = []  # Filters that accept dates with comparison operators
+    _default_filters = {}  # Values Redmine uses for filters that aren't sent, others are considered to match all
     _unconvertible = ['name', 'description']
     _members = ['manager']
     _create_readonly = ['id', 'created_on', 'updated_on', 'author', 'user', 'project', 'issue']
@@ -154,23 +193,21 @@ class BaseResource(metaclass=Registrar):
     _resource_set_map = {}  # Resources that should become a ResourceSet object
     _single_attr_id_map = {}  # Resource attributes that should set another resource id to its value
     _multiple_attr_id_map = {}  # Resource attributes should set another resource ids to their value
+    _encoders = {}  # Compiled by Registrar, maps attributes to the way they should be encoded
+    _getters = {}  # Compiled by Registrar, maps relations and includes to the way they should be accessed
+    _custom_settable = frozenset()  # Compiled by Registrar, members which are set as resource attributes
+    _settable = frozenset()  # Compiled by Registrar, members which are set as instance attributes
+    _create_readonly_attrs = frozenset()  # Compiled by Registrar, attributes which can't be set on create
+    _update_readonly_attrs = frozenset()  # Compiled by Registrar, attributes which can't be set on update
+    _default_attrs = {}  # Compiled by Registrar, attributes every resource has
 
     def __init__(self, manager, attributes):
         """
         :param managers.ResourceManager manager: (required). Manager object.
         :param dict attributes: (required). Resource attributes.
         """
-        relations_includes = self._relations + self._includes
-
         self.manager = manager
-        self._create_readonly = self._create_readonly[:] + relations_includes
-        self._update_readonly = self._update_readonly[:] + relations_includes
-        self._decoded_attrs = dict(dict.fromkeys(relations_includes), **attributes)
-        self._encoded_attrs = {}
-        self._changes = {}
-
-        if self._relations_name is None:
-            self._relations_name = self.__class__.__name__.lower()
+        self._decoded_attrs = dict(self._default_attrs, **attributes)
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
@@ -195,6 +232,11 @@ class BaseResource(metaclass=Registrar):
         Returns the requested attribute and makes a conversion if needed.
         """
         if attr.startswith('_'):
+            # Caches are created on first use, so resources that are never accessed or changed take less memory
+            if attr in ('_encoded_attrs', '_changes'):
+                value = self.__dict__[attr] = {}
+                return value
+
             raise AttributeError
 
         # If this isn't the first time attribute access we can return it from cache
@@ -202,10 +244,12 @@ class BaseResource(metaclass=Registrar):
             return self._encoded_attrs[attr]
 
         # Else this is the first time access hence we need to encode the attribute
-        if attr in self._relations:
-            filters = {f'{self._relations_name}_id': self.internal_id}
+        getter = self._getters.get(attr)
+
+        if getter == 'relation':
+            filters = {self._relation_filter(attr): self.internal_id}
             self._encoded_attrs[attr] = self.manager.new_manager(self._resource_set_map[attr]).filter(**filters)
-        elif attr in self._includes:
+        elif getter == 'include':
             value = self._decoded_attrs[attr] = self._decoded_attrs.pop(self._includes_map.get(attr, attr), None)
 
             if value is None:
@@ -236,13 +280,11 @@ class BaseResource(metaclass=Registrar):
         """
         Sets the requested attribute.
         """
-        custom_settable = [*self._single_attr_id_map, *self._multiple_attr_id_map]
-
-        if attr.startswith('_') or attr in self._members and attr not in custom_settable:
+        if attr.startswith('_') or attr in self._settable:
             return super().__setattr__(attr, value)
-        elif attr in self._create_readonly and self.is_new():
+        elif attr in self._create_readonly_attrs and self.is_new():
             raise exceptions.ReadonlyAttrError
-        elif attr in self._update_readonly and not self.is_new():
+        elif attr in self._update_readonly_attrs and not self.is_new():
             raise exceptions.ReadonlyAttrError
         elif attr == 'custom_fields':
             try:
@@ -272,6 +314,15 @@ class BaseResource(metaclass=Registrar):
         # accessed, the encoding process will be run automatically by __getattr__
         self._encoded_attrs.pop(attr, None)
 
+    @classmethod
+    def _relation_filter(cls, relation):
+        """
+        Returns name of the filter that should be used to retrieve resources of the relation.
+
+        :param string relation: (required). Relation name.
+        """
+        return f'{cls._relations_name_map.get(relation) or cls._relations_name or cls.__name__.lower()}_id'
+
     @classmethod
     def decode(cls, attr, value, manager):
         """
@@ -312,25 +363,43 @@ class BaseResource(metaclass=Registrar):
         :param any value: (required). Attribute value.
         :param managers.ResourceManager manager: (required). Manager object.
         """
-        if attr in cls._unconvertible:
-            return attr, value
-        elif attr in cls._resource_map:
-            return attr, manager.new_manager(cls._resource_map[attr]).to_resource(value)
-        elif attr in cls._resource_set_map:
-            return attr, manager.new_manager(cls._resource_set_map[attr]).to_resource_set(value)
-        elif attr == 'parent':
-            return attr, manager.new_manager(cls.__name__).to_resource(value)
+        encoder = cls._encoders.get(attr)
+
+        if encoder is not None:
+            kind, resource_name = encoder
+
+            if kind == 'unconvertible':
+                return attr, value
+            elif kind == 'resource':
+                return attr, manager.nested_manager(resource_name).to_shared_resource(value)
+
+            return attr, manager.nested_manager(resource_name).to_resource_set(value)
+
+        redmine = manager.redmine
+
+        # Default formats are ISO 8601, so there is a much faster way to convert them
+        if redmine.datetime_format == DATETIME_FORMAT and redmine.date_format == DATE_FORMAT:
+            converted = utilities.fromisoformat(value)
+
+            if converted is None:
+                return attr, value
+            elif type(converted) is date:
+                return attr, converted
+            elif redmine.timezone is not None:
+                converted = converted.replace(tzinfo=timezone.utc).astimezone(redmine.timezone)
+
+            return attr, converted
 
         try:
             try:
-                value = datetime.strptime(value, manager.redmine.datetime_format)
+                value = datetime.strptime(value, redmine.datetime_format)
 
-                if manager.redmine.timezone is not None:
-                    value = value.replace(tzinfo=timezone.utc).astimezone(manager.redmine.timezone)
+                if redmine.timezone is not None:
+                    value = value.replace(tzinfo=timezone.utc).astimezone(redmine.timezone)
 
                 return attr, value
             except (TypeError, ValueError):
-                return attr, datetime.strptime(value, manager.redmine.date_format).date()
+                return attr, datetime.strptime(value, redmine.date_format).date()
         except (TypeError, ValueError):
             return attr, value
 
@@ -85,6 +85,18 @@ class Issue(BaseResource):
     _repr = [['id', 'subject'], ['title'], ['id']]
     _includes = ['children', 'attachments', 'relations', 'changesets', 'journals', 'watchers', 'allowed_statuses']
     _relations = ['relations', 'time_entries']
+    _multiple_filters = {
+        'issue_id': ',',
+        'assigned_to_id': '|',
+        'author_id': '|',
+        'status_id': '|',
+        'tracker_id': '|',
+        'priority_id': '|',
+        'category_id': '|',
+        'fixed_version_id': '|',
+    }
+    _date_filters = ['start_date', 'due_date']
+    _default_filters = {'status_id': 'o'}
     _unconvertible = BaseResource._unconvertible + ['subject', 'notes']
     _create_readonly = BaseResource._create_readonly + ['spent_hours']
     _update_readonly = _create_readonly[:]
@@ -198,6 +210,8 @@ class TimeEntry(BaseResource):
     query_delete = '/time_entries/{}.json'
 
     _repr = [['id']]
+    _multiple_filters = {'user_id': '|'}
+    _date_filters = ['spent_on']
     _resource_map = {'project': 'Project', 'issue': 'Issue', 'user': 'User', 'activity': 'Enumeration'}
     _resource_set_map = {'custom_fields': 'CustomField'}
     _single_attr_id_map = {'project_id': 'project', 'issue_id': 'issue', 'activity_id': 'activity'}
@@ -421,6 +435,7 @@ class User(BaseResource):
     _includes = ['memberships', 'groups']
     _relations = ['issues', 'issues_assigned', 'issues_authored', 'time_entries']
     _relations_name = 'assigned_to'
+    _relations_name_map = {'issues_authored': 'author', 'time_entries': 'user'}
     _unconvertible = ['status']
     _create_readonly = BaseResource._create_readonly + ['api_key', 'last_login_on']
     _update_readonly = _create_readonly[:]
@@ -434,19 +449,6 @@ class User(BaseResource):
         'time_entries': 'TimeEntry',
     }
 
-    def __getattr__(self, attr):
-        if attr in self._relations and attr not in self._encoded_attrs:
-            if attr == 'issues_authored':
-                self._relations_name = 'author'
-            elif attr == 'time_entries':
-                self._relations_name = 'user'
-
-            value = super().__getattr__(attr)
-            self._relations_name = 'assigned_to'
-            return value
-
-        return super().__getattr__(attr)
-
 
 class Group(BaseResource):
     redmine_version = (2, 1, 0)
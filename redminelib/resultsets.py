@@ -2,17 +2,21 @@
 Defines ResourceSet objects that can be used to represent a set of resources.
 """
 
-import operator
-import functools
+import copy
+import datetime
 import itertools
+import contextlib
+import urllib.parse
 
-from . import lookups, exceptions
+from . import lookups, utilities, exceptions
 
 
 class BaseResourceSet:
     """
     Defines basic functionality for a ResourceSet object.
     """
+    _related_chunk = 100  # How many resource ids can be used to filter related resources in a single request
+
     def __init__(self, manager, resources=None, limit=0, offset=0, total_count=None):
         """
         :param managers.ResourceManager manager: (required). ResourceManager object.
@@ -28,11 +32,54 @@ class BaseResourceSet:
         self._resources = resources
         self._total_count = total_count
         self._is_sliced = False
+        self._prefetch_includes = ()
+        self._prefetch_relations = ()
+        self._prefetch_workers = None
+        self._related = {}
+
+    @property
+    def _resources(self):
+        """
+        Returns resources data, indexes built for it are dropped every time it's replaced.
+        """
+        return self._resources_data
+
+    @_resources.setter
+    def _resources(self, resources):
+        self._resources_data = resources
+        self._indexes = {}
+
+    def _index(self, fields):
+        """
+        Returns an index which maps values found by the fields path in resources data to positions of resources,
+        or None if values can't be indexed. Indexes are built on first use and are kept until resources change.
+
+        :param tuple fields: (required). Path to the value in resource data.
+        """
+        if fields not in self._indexes:
+            index = {}
+            get = lookups.getter(fields)
+
+            try:
+                for position, resource in enumerate(self._resources):
+                    try:
+                        value = get(resource)
+                    except KeyError:
+                        continue
+
+                    index.setdefault(value, []).append(position)
+            except TypeError:  # path leads through a non dict or value is unhashable
+                index = None
+
+            self._indexes[fields] = index
+
+        return self._indexes[fields]
 
     @property
     def total_count(self):
         """
-        Returns total count of available resources in Redmine, this is known only after ResourceSet evaluation.
+        Returns total count of available resources in Redmine, this is known only after ResourceSet evaluation
+        or after a call to count method.
         """
         if self._total_count is None:
             if self._resources is None:
@@ -42,6 +89,38 @@ class BaseResourceSet:
 
         return self._total_count
 
+    def count(self):
+        """
+        Returns count of resources in a ResourceSet taking limit and offset into account. If a ResourceSet wasn't
+        evaluated yet, a single resource is requested and count is calculated from total count returned by Redmine,
+        which is cached, all resources are retrieved only if Redmine doesn't support limit and offset for them.
+        """
+        if self._resources is not None:
+            return len(self)
+
+        params = dict(self.manager.params)
+        params.setdefault('limit', self.limit)
+        params.setdefault('offset', self.offset)
+
+        if self._total_count is None:
+            engine = self.manager.redmine.engine
+
+            with self._requirements_check():
+                response = engine.request('get', self.manager.url, params=dict(params, limit=1, offset=0))
+
+            # Redmine returned all resources at once, so they are kept instead of being requested again
+            if response.get('total_count') is None:
+                self._resources, self._total_count = engine.split_bulk_request(
+                    response, self.manager.container, 1, **params)[:2]
+                self._is_sliced = False
+                return len(self._resources)
+
+            self._total_count = response['total_count']
+
+        limit = params['limit'] or 0
+        count = max(self._total_count - (params['offset'] or 0), 0)
+        return min(count, limit) if limit else count
+
     def export(self, fmt, savepath=None, filename=None, columns=None, encoding='UTF-8'):
         """
         Exports all resources from resource set to requested format if Resource supports that.
@@ -90,17 +169,162 @@ class BaseResourceSet:
                 raise exceptions.ExportFormatNotSupportedError
             raise e
 
-    def _resource_cls(self, cls, resources, **kwargs):
+    def _resource_cls(self, cls, resources, manager=None, **kwargs):
         """
         Returns a new resource set class instance defined by cls, filled with resources and loaded with kwargs.
 
         :param any cls: (required). Resource set class.
         :param resources: (required). Iterable of resources.
         :type resources: list or tuple
+        :param managers.ResourceManager manager: (optional). ResourceManager object, the current one if not set.
         :param dict kwargs: (optional). Additional keyword arguments if any.
         """
-        return cls(self.manager, resources=resources, limit=self.limit, offset=self.offset,
-                   total_count=self._total_count, **kwargs)
+        resource_set = cls(manager or self.manager, resources=resources, limit=self.limit, offset=self.offset,
+                           total_count=self._total_count, **kwargs)
+        resource_set._prefetch_includes = self._prefetch_includes
+        resource_set._prefetch_relations = self._prefetch_relations
+        resource_set._prefetch_workers = self._prefetch_workers
+        resource_set._related = self._related
+        return resource_set
+
+    @contextlib.contextmanager
+    def _requirements_check(self):
+        """
+        Replaces not found error of requests for resources with requirements error if resources come from
+        a Redmine plugin, which is probably not installed.
+        """
+        try:
+            yield
+        except exceptions.ResourceNotFoundError as e:
+            if self.manager.resource_class.requirements:
+                raise exceptions.ResourceRequirementsError(self.manager.resource_class.requirements)
+            raise e
+
+    def _includes_requests(self, resources):
+        """
+        Returns resources which don't have includes set by prefetch method yet and requests for these includes.
+
+        :param list resources: (required). Resources data.
+        """
+        resource_class = self.manager.resource_class
+        keys = [resource_class._includes_map.get(include, include) for include in self._prefetch_includes]
+        resources = [resource for resource in resources if any(resource.get(key) is None for key in keys)]
+        params = {'include': ','.join(self._prefetch_includes)}
+        requests = [(self.manager._construct_get_url(resource_class.query_one.format(
+            resource[resource_class.internal_id_key], **self.manager.params)), params) for resource in resources]
+        return resources, requests
+
+    def _attach_includes(self, resources, responses):
+        """
+        Attaches includes from responses to resources data.
+
+        :param list resources: (required). Resources data.
+        :param list responses: (required). Responses in the order of resources.
+        """
+        resource_class = self.manager.resource_class
+        keys = [resource_class._includes_map.get(include, include) for include in self._prefetch_includes]
+
+        for resource, response in zip(resources, responses):
+            for key in keys:
+                resource[key] = response[resource_class.container_one].get(key) or []
+
+    def _prefetch(self, resources):
+        """
+        Requests includes set by prefetch method for all resources which don't have them yet and attaches
+        them to resources data, so that they aren't requested one by one on attribute access.
+
+        :param list resources: (required). Resources data.
+        """
+        resources, requests = self._includes_requests(resources)
+
+        if requests:
+            self._attach_includes(resources, self.manager.redmine.engine.multi_request(
+                'get', requests, self._prefetch_workers))
+
+    async def _aprefetch(self, resources):
+        """
+        Awaitable counterpart of the _prefetch method.
+
+        :param list resources: (required). Resources data.
+        """
+        resources, requests = self._includes_requests(resources)
+
+        if requests:
+            self._attach_includes(resources, await self.manager.redmine.engine.amulti_request(
+                'get', requests, self._prefetch_workers))
+
+    def _related_steps(self, resources):
+        """
+        Yields lists of ResourceSets which should be evaluated to get relations set by prefetch_related method for
+        all resources which don't have them yet, evaluated relations are grouped and stored after each step. If
+        Redmine can filter related resources by many values, they are requested for many resources at once and
+        grouped, otherwise they are requested for each resource separately.
+
+        :param list resources: (required). Resources data.
+        """
+        resource_class = self.manager.resource_class
+
+        for relation in self._prefetch_relations:
+            related = self._related.setdefault(relation, {})
+            ids = list(dict.fromkeys(resource[resource_class.internal_id_key] for resource in resources))
+            ids = [resource_id for resource_id in ids if resource_id not in related]
+
+            if not ids:
+                continue
+
+            resource_name = resource_class._resource_set_map[relation]
+            filter_name = resource_class._relation_filter(relation)
+            resource_sets = {resource_id: self.manager.new_manager(resource_name).filter(**{filter_name: resource_id})
+                             for resource_id in ids}
+            related_class = resource_sets[ids[0]].manager.resource_class
+            separator = related_class._multiple_filters.get(filter_name)
+
+            # Filter can't accept many values if it's a part of the url, e.g. /issues/{issue_id}/relations.json
+            if separator is not None and f'{{{filter_name}}}' not in related_class.query_filter:
+                chunks = [self.manager.new_manager(resource_name).filter(**{filter_name: separator.join(
+                    str(resource_id) for resource_id in ids[i:i + self._related_chunk])})
+                    for i in range(0, len(ids), self._related_chunk)]
+                children = {resource_id: [] for resource_id in ids}
+                yield chunks
+
+                for chunk in chunks:
+                    for child in chunk._resources:
+                        parent_id = (child.get(filter_name[:-3]) or {}).get('id')
+
+                        if parent_id in children:
+                            children[parent_id].append(child)
+
+                for resource_id, resource_set in resource_sets.items():
+                    resource_set._resources = children[resource_id]
+                    resource_set._total_count = len(children[resource_id])
+            else:
+                yield list(resource_sets.values())
+
+            related.update(resource_sets)
+
+    def _prefetch_related(self, resources):
+        """
+        Requests relations set by prefetch_related method for all resources which don't have them yet, related
+        ResourceSets are evaluated concurrently if workers were set.
+
+        :param list resources: (required). Resources data.
+        """
+        engine = self.manager.redmine.engine
+
+        for resource_sets in self._related_steps(resources):
+            engine.concurrent_map(lambda resource_set: resource_set._evaluate(), resource_sets, self._prefetch_workers)
+
+    async def _aprefetch_related(self, resources):
+        """
+        Awaitable counterpart of the _prefetch_related method.
+
+        :param list resources: (required). Resources data.
+        """
+        engine = self.manager.redmine.engine
+
+        for resource_sets in self._related_steps(resources):
+            await engine.aconcurrent_map(lambda resource_set: resource_set.aevaluate(), resource_sets,
+                                         self._prefetch_workers)
 
     def __getitem__(self, item):
         """
@@ -117,52 +341,153 @@ class BaseResourceSet:
                 raise exceptions.ResourceSetIndexError
 
         if self._resources is not None and self._is_sliced:
-            return self._resource_cls(self.__class__, [resource for resource in BaseResourceSet.__iter__(self)])
+            return self._resource_cls(self.__class__, list(self._raw_resources()))
 
         return self
 
-    def __iter__(self):
+    def _evaluate(self):
         """
-        Returns requested resources in a lazy fashion.
+        Retrieves resources from Redmine if this is the first time a ResourceSet is evaluated.
         """
-        # If this is the first time we are evaluating the ResourceSet
-        # all the hard part will be done by the active Engine object
+        # All the hard part will be done by the active Engine object, limit and offset are applied by it as well
         if self._resources is None:
-            self.manager.params.setdefault('limit', self.limit)
-            self.manager.params.setdefault('offset', self.offset)
-
-            try:
+            with self._requirements_check():
                 self._resources, self._total_count = self.manager.redmine.engine.bulk_request(
-                    'get', self.manager.url, self.manager.container, **self.manager.params)
-            except exceptions.ResourceNotFoundError as e:
-                if self.manager.resource_class.requirements:
-                    raise exceptions.ResourceRequirementsError(self.manager.resource_class.requirements)
-                raise e
-
-            resources = self._resources
-        # Otherwise ResourceSet object should handle slicing by itself
-        elif self._is_sliced:
-            offset = self.offset or None
-
-            if not self.limit:
-                limit = None
-            elif self.limit and not self.offset:
-                limit = self.limit
-            else:
-                limit = self.limit + self.offset
+                    'get', self.manager.url, self.manager.container, **self._bulk_params())
 
-            resources = self._resources[offset:limit]
-        else:
-            resources = self._resources
+            self._is_sliced = False
 
+    def _bulk_params(self):
+        """
+        Sets limit and offset of a ResourceSet to params of a manager unless they are set there already and
+        returns params that should be used for resources retrieval.
+        """
+        self.manager.params.setdefault('limit', self.limit)
+        self.manager.params.setdefault('offset', self.offset)
+        return self.manager.params
+
+    def _raw_resources(self):
+        """
+        Returns resources data requested by limit and offset without requesting includes and relations set by
+        prefetch methods, so that helpers which select only some resources don't request them for all resources.
+        """
+        self._evaluate()
+        return self._evaluated_resources()
+
+    def _evaluated_resources(self):
+        """
+        Returns already retrieved resources requested by limit and offset, which are applied only once.
+        """
+        # ResourceSet object should handle slicing of already retrieved resources by itself
+        resources = self._resources[self._slice()] if self._is_sliced else self._resources
         self._is_sliced = False
+        return resources
+
+    def _slice(self):
+        """
+        Returns a slice of already retrieved resources which is requested by limit and offset.
+        """
+        if not self._is_sliced:
+            return slice(None)
+
+        return slice(self.offset or None, self.limit + (self.offset or 0) if self.limit else None)
+
+    def __iter__(self):
+        """
+        Returns requested resources in a lazy fashion.
+        """
+        self._evaluate()
+        resources = self._evaluated_resources()
+
+        if self._prefetch_includes:
+            self._prefetch(resources)
+
+        if self._prefetch_relations:
+            self._prefetch_related(resources)
+
         return (resource for resource in resources)
 
+    async def aevaluate(self):
+        """
+        Evaluates ResourceSet in an awaitable fashion, so it can be used afterwards without blocking.
+        """
+        if self._resources is None:
+            with self._requirements_check():
+                self._resources, self._total_count = await self.manager.redmine.engine.abulk_request(
+                    'get', self.manager.url, self.manager.container, **self._bulk_params())
+
+            # Limit and offset were already applied by the Engine
+            self._is_sliced = False
+
+        return self
+
+    async def __aiter__(self):
+        """
+        Allows a ResourceSet object to be used in async for statement, includes and relations set by prefetch
+        methods are requested in an awaitable fashion as well.
+        """
+        await self.aevaluate()
+        resources = self._evaluated_resources()
+
+        if self._prefetch_includes:
+            await self._aprefetch(resources)
+
+        if self._prefetch_relations:
+            await self._aprefetch_related(resources)
+
+        for resource in resources:
+            yield self._to_resource(resource)
+
+    def _to_resource(self, resource):
+        """
+        Converts resource data to the type of values a ResourceSet yields, which is resource data itself by default.
+
+        :param dict resource: (required). Resource data.
+        """
+        return resource
+
+    def _iter_pages(self, chunk_size=None, prefetch=None):
+        """
+        Yields lists of resources page by page as they are received from Redmine without caching them, if
+        a ResourceSet was already evaluated, all of its resources are yielded as a single page.
+
+        :param int chunk_size: (optional). How many resources to request at once, engine's chunk is used if not set.
+        :param int prefetch: (optional). How many pages to request ahead, engine's prefetch is used if not set.
+        """
+        if self._resources is not None:
+            yield list(BaseResourceSet.__iter__(self))
+            return
+
+        params = dict(self.manager.params)
+        params.setdefault('limit', self.limit)
+        params.setdefault('offset', self.offset)
+        pages = self.manager.redmine.engine.iter_bulk_request(
+            'get', self.manager.url, self.manager.container, chunk=chunk_size, prefetch=prefetch, **params)
+
+        with self._requirements_check():
+            for resources, self._total_count in pages:
+                if self._prefetch_includes:
+                    self._prefetch(resources)
+
+                # Relations are kept only for the current page, so memory usage doesn't grow
+                if self._prefetch_relations:
+                    self._related = {}
+                    self._prefetch_related(resources)
+
+                yield resources
+
     def __len__(self):
         """
-        Allows len() to be called on a ResourceSet object.
+        Allows len() to be called on a ResourceSet object, after evaluation length is known without iteration.
+        """
+        self._evaluate()
+        return len(range(len(self._resources))[self._slice()])
+
+    def __bool__(self):
+        """
+        Allows a ResourceSet object to be checked for emptiness without creating Resource objects.
         """
-        return sum(1 for _ in self)
+        return len(self) > 0
 
     def __repr__(self):
         """
@@ -186,54 +511,161 @@ class ResourceSet(BaseResourceSet):
         :type resource_id: int or string
         :param none default: (optional). What to return if Resource wasn't found.
         """
-        for resource in super().__iter__():
+        if self._resources is not None and not self._is_sliced:
+            index = self._index((self.manager.resource_class.internal_id_key,))
+
+            if index is not None:
+                try:
+                    positions = index.get(resource_id)
+                except TypeError:
+                    return default
+
+                if positions is None:
+                    return default
+
+                resource = self._resources[positions[0]]
+
+                if self._prefetch_includes:
+                    self._prefetch([resource])
+
+                if self._prefetch_relations:
+                    self._prefetch_related([resource])
+
+                return self._to_resource(resource)
+
+        for resource in self._raw_resources():
             if resource_id == resource[self.manager.resource_class.internal_id_key]:
-                return self.manager.to_resource(resource)
+                if self._prefetch_includes:
+                    self._prefetch([resource])
+
+                if self._prefetch_relations:
+                    self._prefetch_related([resource])
+
+                return self._to_resource(resource)
 
         return default
 
+    def _index_lookup(self, reducers):
+        """
+        Returns resources data which may satisfy reducers found with the help of an index by the first exact or
+        in lookup which can be indexed, or None if there are no such lookups or a ResourceSet wasn't evaluated.
+
+        :param list reducers: (required). Reducers used for resources filtering.
+        """
+        if self._resources is None or self._is_sliced:
+            return None
+
+        for r in reducers:
+            if r['lookup'] is lookups.registry['exact']:
+                values = [r['value']]
+            elif r['lookup'] is lookups.registry['in'] and isinstance(r['value'], (list, tuple, set, frozenset)):
+                values = r['value']
+            else:
+                continue
+
+            index = self._index(tuple(r['fields']))
+
+            if index is None:
+                continue
+
+            try:
+                positions = sorted(set(itertools.chain.from_iterable(index.get(value, ()) for value in values)))
+            except TypeError:  # requested value is unhashable
+                continue
+
+            return [self._resources[position] for position in positions]
+
+        return None
+
+    def _pushdown(self, filters):
+        """
+        Translates filters, which Redmine is able to apply by itself, to params of a new unevaluated ResourceSet.
+        Returns the new ResourceSet, or None if no filters can be translated, and filters that are left.
+
+        :param dict filters: (required). Filters used for resources retrieval.
+        """
+        # Filters can't be applied by Redmine to resources that are already retrieved or to a slice of them
+        if self._resources is not None or self.limit or self.offset or self.manager.params.get('limit') \
+                or self.manager.params.get('offset'):
+            return None, filters
+
+        resource_class = self.manager.resource_class
+        url, _, query = self.manager.url.partition('?')
+        query = dict(urllib.parse.parse_qsl(query, keep_blank_values=True))
+        params, left = {}, {}
+
+        for filter_name, value in filters.items():
+            fields, lookup = lookups.parse(filter_name)
+            name = separator = None
+
+            # Ids can be translated, e.g. id of an issue to issue_id or status__id of an issue to status_id
+            if lookup.pushdown_kind == 'id':
+                if fields == [resource_class.internal_id_key]:
+                    name = f'{resource_class.__name__.lower()}_id'
+                elif len(fields) == 2 and fields[1] == 'id':
+                    name = f'{fields[0]}_id'
+
+                separator = resource_class._multiple_filters.get(name)
+            # As well as dates, e.g. start_date__range of an issue to start_date with >< operator
+            elif lookup.pushdown_kind == 'date' and len(fields) == 1 and fields[0] in resource_class._date_filters:
+                name, separator = fields[0], '|'
+
+            value = None if separator is None else lookup.pushdown(value, separator)
+
+            # Redmine accepts a single value for each filter, so only the one that allows any value can be replaced,
+            # filters that aren't sent may still have a default value, e.g. only open issues are returned by Redmine
+            current = self.manager.params.get(name, query.get(name, resource_class._default_filters.get(name, '*')))
+
+            if value is None or name in params or current != '*':
+                left[filter_name] = filters[filter_name]
+            else:
+                params[name] = value
+
+        if not params:
+            return None, filters
+
+        manager = copy.copy(self.manager)
+        manager.params = dict(self.manager.params, **params)
+
+        if any(name in query for name in params):
+            query = urllib.parse.urlencode([item for item in query.items() if item[0] not in params], safe='*')
+            manager.url = f'{url}?{query}' if query else url
+
+        resource_set = self._resource_cls(ResourceSet, None, manager=manager)
+        resource_set._total_count = None  # total count of the unfiltered resources doesn't apply anymore
+        return resource_set, left
+
     def filter(self, **filters):
         """
-        Returns a new filtered ResourceSet with requested filters applied.
+        Returns a new filtered ResourceSet with requested filters applied. Filters that Redmine is able to apply
+        by itself are sent to Redmine if a ResourceSet wasn't evaluated yet, others are applied locally.
 
         :param dict filters: (required). Filters used for resources retrieval.
         """
         if not filters:
             raise exceptions.ResourceNoFiltersProvidedError
 
+        resource_set, filters = self._pushdown(filters)
+
+        if resource_set is not None:
+            return resource_set.filter(**filters) if filters else resource_set
+
         reducers = []
 
         for f in filters:
-            fields = f.split('__')
-            lookup = fields[-1]
-
-            reducer = {
+            fields, lookup = lookups.parse(f)
+            reducers.append({
                 'fields': fields,
                 'value': filters[f],
-                'lookup': lookups.registry['exact'],
-                'lookup_name': lookup,
+                'lookup': lookup,
+                'lookup_name': f.split('__')[-1],
                 'filter_name': f,
-            }
-
-            if lookup in lookups.registry:
-                reducer['fields'] = fields[:-1]
-                reducer['lookup'] = lookups.registry[lookup]
+            })
 
-            reducers.append(reducer)
-
-        resources = []
-
-        for resource in super().__iter__():
-            for r in reducers:
-                try:
-                    if not r['lookup'](functools.reduce(operator.getitem, r['fields'], resource), r['value']):
-                        break
-                except KeyError:
-                    break
-                except TypeError:
-                    raise exceptions.ResourceSetFilterLookupError(r['lookup_name'], r['filter_name'])
-            else:
-                resources.append(resource)
+        predicate = lookups.compile_filters(reducers)
+        candidates = self._index_lookup(reducers)
+        resources = [resource for resource in (self._raw_resources() if candidates is None else candidates)
+                     if predicate(resource)]
 
         return self._resource_cls(ResourceSet, resources)
 
@@ -271,10 +703,10 @@ class ResourceSet(BaseResourceSet):
         :type fields: list or tuple
         """
         if fields:
-            for resource in super().__iter__():
+            for resource in self._values_resources(fields):
                 yield {field: resource[field] for field in fields if field in resource}
         else:
-            for resource in super().__iter__():
+            for resource in self._values_resources(fields):
                 yield resource
 
     def values_list(self, *fields, **kwargs):
@@ -289,17 +721,221 @@ class ResourceSet(BaseResourceSet):
 
         if fields:
             if flat and len(fields) == 1:
-                for resource in super().__iter__():
+                for resource in self._values_resources(fields):
                     yield resource.get(fields[0])
             else:
-                for resource in super().__iter__():
+                for resource in self._values_resources(fields):
                     yield tuple(resource[field] for field in fields if field in resource)
         else:
-            for resource in super().__iter__():
+            for resource in self._values_resources(fields):
                 yield tuple(resource.values())
 
+    def _values_resources(self, fields):
+        """
+        Returns resources data for values methods, includes set by prefetch method are requested only if they are
+        among the requested fields, relations are never requested because they aren't a part of resources data.
+
+        :param tuple fields: (required). Requested fields, all fields if empty.
+        """
+        resources = self._raw_resources()
+
+        if self._prefetch_includes:
+            resource_class = self.manager.resource_class
+            keys = {resource_class._includes_map.get(include, include) for include in self._prefetch_includes}
+
+            if not fields or keys.intersection(fields):
+                self._prefetch(resources)
+
+        return resources
+
+    def to_columns(self, *fields, chunk_size=None, prefetch=None):
+        """
+        Returns ResourceSet as a dictionary of columns, i.e. lists of values, which are collected directly from
+        resource data page by page without creating Resource objects.
+
+        :param fields: (optional). Column paths, e.g. id, status.name or custom_fields[id=5].value, all top level
+         fields are used if not set.
+        :type fields: list or tuple
+        :param int chunk_size: (optional). How many resources to request at once, engine's chunk is used if not set.
+        :param int prefetch: (optional). How many pages to request ahead, engine's prefetch is used if not set.
+        """
+        columns = {field: [] for field in fields}
+        getters = [(columns[field], utilities.path_getter(field)) for field in columns]
+        length = 0
+
+        for resources in self._iter_pages(chunk_size, prefetch):
+            if fields:
+                for column, get in getters:
+                    column.extend(get(resource) for resource in resources)
+            else:
+                for resource in resources:
+                    for field in resource:
+                        if field not in columns:
+                            columns[field] = [None] * length
+
+                    for field, column in columns.items():
+                        column.append(resource.get(field))
+
+                    length += 1
+
+        return columns
+
+    @staticmethod
+    def _date_format(column):
+        """
+        Returns strptime format of dates in a column judging by its first non-null value or None if it's not a date.
+
+        :param list column: (required). Column values.
+        """
+        value = utilities.fromisoformat(next((value for value in column if value is not None), None))
+
+        if isinstance(value, datetime.datetime):
+            return '%Y-%m-%dT%H:%M:%SZ'
+        elif isinstance(value, datetime.date):
+            return '%Y-%m-%d'
+
+        return None
+
+    def to_arrow(self, *fields, chunk_size=None, prefetch=None):
+        """
+        Returns ResourceSet as a pyarrow Table, date columns are converted to date32 and datetime columns to UTC
+        timestamp types at once for the whole column. Requires pyarrow to be installed.
+
+        :param fields: (optional). Column paths, see to_columns() for details.
+        :type fields: list or tuple
+        :param int chunk_size: (optional). How many resources to request at once, engine's chunk is used if not set.
+        :param int prefetch: (optional). How many pages to request ahead, engine's prefetch is used if not set.
+        """
+        import pyarrow
+        import pyarrow.compute
+
+        arrays = {}
+
+        for field, column in self.to_columns(*fields, chunk_size=chunk_size, prefetch=prefetch).items():
+            try:
+                array = pyarrow.array(column)
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                array = pyarrow.array([None if value is None else str(value) for value in column])
+
+            date_format = self._date_format(column)
+
+            if date_format is not None and pyarrow.types.is_string(array.type):
+                try:
+                    array = pyarrow.compute.strptime(array, format=date_format, unit='s')
+                except pyarrow.ArrowInvalid:
+                    pass
+                else:
+                    # Redmine returns datetimes in UTC regardless of a timezone set for Redmine object
+                    if date_format == '%Y-%m-%d':
+                        array = array.cast(pyarrow.date32())
+                    else:
+                        array = array.cast(pyarrow.timestamp('s', tz='UTC'))
+
+            arrays[field] = array
+
+        return pyarrow.table(arrays)
+
+    def to_pandas(self, *fields, chunk_size=None, prefetch=None):
+        """
+        Returns ResourceSet as a pandas DataFrame, date columns are converted to datetime64 type and datetime
+        columns to UTC datetime64 type at once for the whole column. Requires pandas to be installed.
+
+        :param fields: (optional). Column paths, see to_columns() for details.
+        :type fields: list or tuple
+        :param int chunk_size: (optional). How many resources to request at once, engine's chunk is used if not set.
+        :param int prefetch: (optional). How many pages to request ahead, engine's prefetch is used if not set.
+        """
+        import pandas
+
+        columns = self.to_columns(*fields, chunk_size=chunk_size, prefetch=prefetch)
+
+        for field, column in columns.items():
+            date_format = self._date_format(column)
+
+            if date_format is not None:
+                try:
+                    columns[field] = pandas.to_datetime(column, format=date_format, utc=date_format != '%Y-%m-%d')
+                except (TypeError, ValueError):
+                    pass
+
+        return pandas.DataFrame(columns)
+
+    def prefetch(self, *includes, workers=None):
+        """
+        Requests includes for all resources in a ResourceSet at once when it's evaluated instead of requesting them
+        one by one for each resource on attribute access.
+
+        :param includes: (required). Names of includes, e.g. journals or watchers.
+        :param int workers: (optional). How many requests can be made at the same time, engine decides if not set.
+        """
+        resource_class = self.manager.resource_class
+
+        for include in includes:
+            if include not in resource_class._includes or resource_class.query_one is None:
+                raise exceptions.ResourceSetPrefetchError(include)
+
+        self._prefetch_includes = tuple(dict.fromkeys(self._prefetch_includes + includes))
+        self._prefetch_workers = workers
+        return self
+
+    def prefetch_related(self, *relations, workers=None):
+        """
+        Requests relations, e.g. time entries of issues, for all resources in a ResourceSet at once when it's
+        evaluated instead of requesting them one by one for each resource on attribute access.
+
+        :param relations: (required). Names of relations, e.g. time_entries or issues.
+        :param int workers: (optional). How many requests can be made at the same time, engine decides if not set.
+        """
+        for relation in relations:
+            if relation not in self.manager.resource_class._relations:
+                raise exceptions.ResourceSetPrefetchError(relation)
+
+        self._prefetch_relations = tuple(dict.fromkeys(self._prefetch_relations + relations))
+        self._prefetch_workers = workers
+        return self
+
+    def share_nested(self):
+        """
+        Enables identity map for nested resources of this ResourceSet, i.e. nested resources with the same id,
+        e.g. projects or authors of issues, are represented by one shared object instead of a separate one for
+        each resource.
+        """
+        if self.manager.identity_map is None:
+            self.manager.identity_map = utilities.IdentityMap()
+
+        return self
+
+    def iterator(self, chunk_size=None, prefetch=None):
+        """
+        Returns requested resources in a streaming fashion, i.e. next page of resources is requested from Redmine
+        only after all resources from the current page were consumed. Resources aren't cached, so it's possible
+        to iterate over a huge amount of resources without loading all of them into memory.
+
+        :param int chunk_size: (optional). How many resources to request at once, engine's chunk is used if not set.
+        :param int prefetch: (optional). How many pages to request ahead, engine's prefetch is used if not set.
+        """
+        for resources in self._iter_pages(chunk_size, prefetch):
+            for resource in resources:
+                yield self._to_resource(resource)
+
+    def _to_resource(self, resource):
+        """
+        Converts resource data to Resource object and attaches prefetched relations to it.
+
+        :param dict resource: (required). Resource data.
+        """
+        resource_obj = self.manager.to_resource(resource)
+
+        for relation in self._prefetch_relations:
+            related = self._related.get(relation, {}).get(resource[resource_obj.internal_id_key])
+
+            if related is not None:
+                resource_obj._encoded_attrs[relation] = related
+
+        return resource_obj
+
     def __iter__(self):
         """
         Returns requested resources in a lazy fashion.
         """
-        return (self.manager.to_resource(resource) for resource in super().__iter__())
+        return (self._to_resource(resource) for resource in super().__iter__())
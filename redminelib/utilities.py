@@ -2,8 +2,12 @@
 Provides helper utilities.
 """
 
+import re
 import copy
 import string
+import weakref
+import datetime
+import functools
 import urllib.parse
 
 from . import exceptions
@@ -41,6 +45,80 @@ def merge_dicts(a, b):
     return result
 
 
+@functools.lru_cache(maxsize=256)
+def to_resource_name(name):
+    """
+    Converts manager name, e.g. time_entry, to resource class name, e.g. TimeEntry. Results are memoized, because
+    there is a limited number of names, but conversion is done each time a manager is requested.
+
+    :param string name: (required). Manager name.
+    """
+    return ''.join(word[0].upper() + word[1:] for word in name.split('_'))
+
+
+def fromisoformat(value):
+    """
+    Converts a string in Redmine's default format, i.e. YYYY-MM-DDTHH:MM:SSZ or YYYY-MM-DD, to a naive datetime or
+    date, returns None if it can't be converted. Shape of a string is checked first, so most strings which are not
+    dates are rejected without raising an exception, which is much faster than strptime().
+
+    :param string value: (required). String to convert.
+    """
+    if not isinstance(value, str):
+        return None
+
+    length = len(value)
+
+    try:
+        if length == 20 and value[19] == 'Z' and value[10] == 'T' and value[4] == value[7] == '-' \
+                and value[13] == value[16] == ':':
+            return datetime.datetime.fromisoformat(value[:19])
+        elif length == 10 and value[4] == value[7] == '-':
+            return datetime.date.fromisoformat(value)
+    except ValueError:
+        pass
+
+    return None
+
+
+def path_getter(path):
+    """
+    Returns a function which gets a value by a column path from resource data, e.g. status.name or
+    custom_fields[id=5].value, where [key=value] selects the first list item which has this value of the key.
+    None is returned if any part of the path is missing in resource data.
+
+    :param string path: (required). Column path to the value in resource data.
+    """
+    segments = re.findall(r'([^.\[\]]+)(?:\[([^=\]]+)=([^\]]*)\])?', path)
+
+    def get(resource):
+        value = resource
+
+        for key, match_key, match_value in segments:
+            if not isinstance(value, dict):
+                return None
+
+            value = value.get(key)
+
+            if match_key:
+                value = next((item for item in value or () if isinstance(item, dict)
+                              and str(item.get(match_key)) == match_value), None)
+
+        return value
+
+    return get
+
+
+class IdentityMap(weakref.WeakValueDictionary):
+    """
+    Maps resource class and id pairs to resource objects, so that equal resources can share one object.
+    Resources are weakly referenced and are removed from the map as soon as they aren't used anymore.
+    """
+    def __reduce__(self):
+        # Weak references can't be pickled, so a new empty map is created instead
+        return self.__class__, ()
+
+
 class ResourceQueryFormatter(string.Formatter):
     """
     Quotes query and memorizes all arguments, used during string formatting.
@@ -20,3 +20,11 @@ class BaseRedmineTestCase(TestCase):
     def set_patch_side_effect(self, side_effect):
         for target in self.patch_targets:
             getattr(self, f'{self.patch_prefix}_{target}').side_effect = side_effect
+
+    @staticmethod
+    def paging_response(params, total_count, container='issues', max_limit=None):
+        # Redmine silently decreases limit to its per page maximum, which is mimicked by max_limit
+        offset, limit = params['offset'], min(params['limit'], max_limit or params['limit'])
+        return mock.Mock(status_code=200, history=[], content=b'x' * limit, **{'json.return_value': {
+            'total_count': total_count, 'limit': limit, 'offset': offset,
+            container: [{'id': i} for i in range(offset, min(offset + limit, total_count))]}})
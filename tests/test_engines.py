@@ -1,3 +1,6 @@
+import json
+import asyncio
+import itertools
 import warnings
 
 from . import mock, BaseRedmineTestCase, Redmine
@@ -14,6 +17,32 @@ class BaseEngineTestCase(BaseRedmineTestCase):
         redmine = Redmine(self.url, username='john', password='qwerty')
         self.assertEqual(redmine.engine.requests['auth'], ('john', 'qwerty'))
 
+    def test_engine_options_are_sent_with_each_request(self):
+        redmine = Redmine(self.url, key='123', impersonate='jsmith', requests={'params': {'foo': 'bar'}, 'timeout': 2})
+        redmine.engine.request('get', self.url, headers={'Accept': 'application/json'}, params={'limit': 1})
+        kwargs = self.patch_requests.call_args[1]
+        self.assertEqual(kwargs['headers'], {
+            'X-Redmine-API-Key': '123', 'X-Redmine-Switch-User': 'jsmith', 'Accept': 'application/json'})
+        self.assertEqual(kwargs['params'], {'foo': 'bar', 'limit': 1})
+        self.assertEqual(kwargs['timeout'], 2)
+        self.assertEqual(redmine.engine.requests['headers'], {
+            'X-Redmine-API-Key': '123', 'X-Redmine-Switch-User': 'jsmith'})
+
+    def test_connection_pool_options(self):
+        adapter = self.redmine.engine.session.get_adapter(self.url)
+        self.assertEqual((adapter._pool_connections, adapter._pool_maxsize, adapter._pool_block), (10, 10, False))
+        redmine = Redmine(self.url, pool_connections=2, pool_maxsize=32, pool_block=True)
+        adapter = redmine.engine.session.get_adapter(self.url)
+        self.assertIs(adapter, redmine.engine.session.get_adapter('http://foo.bar'))
+        self.assertEqual((adapter._pool_connections, adapter._pool_maxsize, adapter._pool_block), (2, 32, True))
+        self.assertIs(redmine.issue.redmine.engine.session, redmine.project.redmine.engine.session)
+
+    def test_keep_alive_option(self):
+        self.assertNotIn('Connection', self.redmine.engine.requests['headers'])
+        redmine = Redmine(self.url, keep_alive=False)
+        redmine.engine.request('get', self.url)
+        self.assertEqual(self.patch_requests.call_args[1]['headers']['Connection'], 'close')
+
     def test_successful_response_via_username_password(self):
         self.redmine.engine.requests['auth'] = ('john', 'qwerty')
         self.response.status_code = 200
@@ -104,6 +133,52 @@ class BaseEngineTestCase(BaseRedmineTestCase):
             self.assertEqual(len(w), 1)
             self.assertIs(w[0].category, exceptions.PerformanceWarning)
 
+    def test_bulk_request_with_custom_chunk(self):
+        self.response.json.return_value = {'total_count': 120, 'limit': 50, 'offset': 0, 'issues': [{'id': 1}] * 50}
+        redmine = Redmine(self.url, chunk=50)
+        issues, total_count = redmine.engine.bulk_request('get', self.url, 'issues')
+        self.assertEqual(len(issues), 150)
+        self.assertEqual([call[1]['params']['limit'] for call in self.patch_requests.call_args_list], [50, 50, 20])
+
+    def test_bulk_request_respects_redmine_per_page_limit(self):
+        self.response.json.return_value = {'total_count': 60, 'limit': 25, 'offset': 0, 'issues': [{'id': 1}] * 25}
+        issues, total_count = self.redmine.engine.bulk_request('get', self.url, 'issues')
+        self.assertEqual(len(issues), 75)
+        self.assertEqual([call[1]['params']['offset'] for call in self.patch_requests.call_args_list], [0, 25, 50])
+
+    def test_adaptive_chunk_discovers_redmine_per_page_limit(self):
+        self.set_patch_side_effect(
+            lambda method, url, params=None, **kwargs: self.paging_response(params, 700, max_limit=200))
+        redmine = Redmine(self.url, min_chunk=50, max_chunk=1000)
+        self.assertEqual(redmine.engine.first_chunk, 1000)
+        issues, total_count = redmine.engine.bulk_request('get', self.url, 'issues')
+        self.assertEqual([issue['id'] for issue in issues], list(range(700)))
+        self.assertEqual(redmine.engine.server_chunk, 200)
+        self.assertEqual(redmine.engine.first_chunk, 200)
+        self.assertEqual([call[1]['params']['limit'] for call in self.patch_requests.call_args_list][0], 1000)
+        self.assertEqual([issue.id for issue in redmine.issue.all().iterator()], list(range(700)))
+
+    @mock.patch('redminelib.engines.base.time.monotonic', mock.Mock(side_effect=itertools.count(0, 10)))
+    def test_adaptive_chunk_is_used_after_discovery(self):
+        self.set_patch_side_effect(lambda method, url, params=None, **kwargs: self.paging_response(params, 300))
+        redmine = Redmine(self.url, min_chunk=10, max_chunk=100)
+        redmine.engine.bulk_request('get', self.url, 'issues')
+        self.assertEqual(redmine.engine.server_chunk, 100)
+        self.assertEqual(redmine.engine.first_chunk, 10)
+        self.patch_requests.reset_mock()
+        redmine.engine.bulk_request('get', self.url, 'issues')
+        self.assertEqual({call[1]['params']['limit'] for call in self.patch_requests.call_args_list}, {10})
+
+    def test_adaptive_chunk_calculation(self):
+        redmine = Redmine(self.url, min_chunk=10, max_chunk=1000, chunk_bytes=10000)
+        self.assertEqual(redmine.engine.adapt_chunk(100, 2.0, 0), 50)
+        self.assertEqual(redmine.engine.adapt_chunk(100, 0.1, 0), 200)
+        self.assertEqual(redmine.engine.adapt_chunk(100, 0.1, 100000), 10)
+        self.assertEqual(redmine.engine.adapt_chunk(100, 100.0, 0), 10)
+        self.assertEqual(redmine.engine.adapt_chunk(0, 100.0, 0), 100)
+        redmine.engine.server_chunk = 150
+        self.assertEqual(redmine.engine.adapt_chunk(100, 0.01, 0), 150)
+
     def test_engine_is_picklable(self):
         import pickle
         self.redmine.engine.requests['params']['key'] = '123'
@@ -111,3 +186,439 @@ class BaseEngineTestCase(BaseRedmineTestCase):
         redmine = pickle.loads(pickle.dumps(self.redmine))
         self.assertEqual(redmine.engine.requests['params']['key'], '123')
         self.assertEqual(redmine.engine.requests['headers']['X-Redmine-Switch-User'], 'jsmith')
+
+    @mock.patch('redminelib.engines.base.time.sleep')
+    def test_retries_transient_errors(self, sleep):
+        import requests
+        responses = [requests.ConnectionError(), mock.Mock(status_code=503, history=[], headers={'Retry-After': '7'}),
+                     mock.Mock(status_code=200, history=[], **{'json.return_value': {'success': True}})]
+        self.set_patch_side_effect(responses)
+        redmine = Redmine(self.url, retries=engines.Retry(total=2, backoff_factor=1, jitter=0))
+        self.assertEqual(redmine.engine.request('get', self.url)['success'], True)
+        self.assertEqual(self.patch_requests.call_count, 3)
+        self.assertEqual([call[0][0] for call in sleep.call_args_list], [1, 7])
+
+    @mock.patch('redminelib.engines.base.time.sleep')
+    def test_retries_are_limited(self, sleep):
+        self.response.status_code = 500
+        self.response.headers = {}
+        self.assertRaises(exceptions.ServerError, lambda: self.redmine.engine.request('get', self.url))
+        self.assertEqual(self.patch_requests.call_count, 1)
+        redmine = Redmine(self.url, retries=2)
+        self.assertRaises(exceptions.ServerError, lambda: redmine.engine.request('get', self.url))
+        self.assertEqual(self.patch_requests.call_count, 4)
+        self.assertRaises(exceptions.ServerError, lambda: redmine.engine.request('post', self.url))
+        self.assertEqual(self.patch_requests.call_count, 5)
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_retry_delay(self):
+        retry = engines.Retry(total=5, backoff_factor=0.5, backoff_max=3, jitter=0)
+        self.assertEqual([retry.get_delay('get', attempt) for attempt in range(6)], [0.5, 1, 2, 3, 3, None])
+        self.assertEqual(retry.get_delay('get', 0, 429, '120'), 3)
+        self.assertEqual(retry.get_delay('get', 0, 429, 'Wed, 21 Oct 2015 07:28:00 GMT'), 0)
+        self.assertEqual(retry.get_delay('get', 0, 429, 'foo'), 0.5)
+        self.assertIsNone(retry.get_delay('get', 0, 404))
+        self.assertIsNone(retry.get_delay('post', 0, 503))
+        self.assertIsNone(retry.get_delay('put', 0, 503))
+        self.assertIsNone(retry.get_delay('delete', 0))
+        self.assertEqual(engines.Retry(methods=('put',), jitter=0).get_delay('put', 0, 503), 0.5)
+        retry = engines.Retry(backoff_factor=1, jitter=0.5)
+        self.assertTrue(all(0.5 <= retry.get_delay('get', 0) <= 1 for _ in range(100)))
+
+    def test_rate_limiter_options(self):
+        self.assertIsNone(self.redmine.engine.limiter.rate)
+        self.assertIsNone(self.redmine.engine.limiter.max_in_flight)
+        redmine = Redmine(self.url, rate_limit=5, rate_burst=10, max_in_flight=3)
+        self.assertEqual(redmine.engine.limiter.rate, 5)
+        self.assertEqual(redmine.engine.limiter.burst, 10)
+        self.assertEqual(redmine.engine.limiter.max_in_flight, 3)
+        self.assertIs(redmine.issue.redmine.engine.limiter, redmine.project.redmine.engine.limiter)
+
+    @mock.patch('redminelib.engines.limiter.time')
+    def test_rate_limiter_spreads_requests(self, patch_time):
+        patch_time.monotonic.return_value = 100.0
+        redmine = Redmine(self.url, rate_limit=2, rate_burst=2)
+        for _ in range(4):
+            redmine.engine.request('get', self.url)
+        self.assertEqual([call[0][0] for call in patch_time.sleep.call_args_list], [0.5, 1.0])
+        patch_time.monotonic.return_value = 110.0
+        self.assertEqual(redmine.engine.limiter.reserve(), 0)
+        self.assertEqual(self.patch_requests.call_count, 4)
+
+    def test_rate_limiter_limits_requests_in_flight(self):
+        import threading
+        import time
+        lock = threading.Lock()
+        in_flight = [0]
+
+        def side_effect(*args, **kwargs):
+            with lock:
+                in_flight.append(in_flight[-1] + 1)
+            time.sleep(0.01)
+            with lock:
+                in_flight.append(in_flight[-1] - 1)
+            return self.response
+
+        self.set_patch_side_effect(side_effect)
+        redmine = Redmine(self.url, max_in_flight=2)
+        threads = [threading.Thread(target=redmine.engine.request, args=('get', self.url)) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(max(in_flight), 2)
+        self.assertEqual(self.patch_requests.call_count, 6)
+
+    def test_rate_limiter_is_picklable(self):
+        import pickle
+        redmine = pickle.loads(pickle.dumps(Redmine(self.url, rate_limit=5, max_in_flight=3)))
+        self.assertEqual((redmine.engine.limiter.rate, redmine.engine.limiter.max_in_flight), (5, 3))
+        redmine.engine.request('get', self.url)
+
+    def test_cache_options(self):
+        self.assertIsNone(self.redmine.engine.cache)
+        redmine = Redmine(self.url, cache=True, cache_ttl=60)
+        self.assertIsInstance(redmine.engine.cache, engines.MemoryCache)
+        self.assertEqual(redmine.engine.cache_ttl, 60)
+        cache = engines.MemoryCache()
+        self.assertIs(Redmine(self.url, cache=cache).engine.cache, cache)
+
+    def test_cache_returns_cached_responses(self):
+        self.response.content = b'{"trackers": [{"id": 1}]}'
+        self.response.json.return_value = {'trackers': [{'id': 1}]}
+        self.response.headers = {}
+        redmine = Redmine(self.url, key='123', cache=True)
+        trackers = redmine.engine.request('get', self.url, params={'foo': 'bar'})
+        trackers['trackers'].append({'id': 2})
+        self.assertEqual(redmine.engine.request('get', self.url, params={'foo': 'bar'}), {'trackers': [{'id': 1}]})
+        self.assertEqual(self.patch_requests.call_count, 1)
+        redmine.engine.request('get', self.url, params={'foo': 'baz'})
+        redmine.engine.request('post', f'{self.url}/uploads.json', params={'foo': 'bar'})
+        with redmine.session(key='456'):
+            redmine.engine.request('get', self.url, params={'foo': 'bar'})
+        with redmine.session(return_raw_response=True):
+            redmine.engine.request('get', self.url, params={'foo': 'bar'})
+        self.assertEqual(self.patch_requests.call_count, 5)
+        self.assertEqual(len(redmine.engine.cache), 3)
+
+    def test_cache_is_invalidated_by_changes(self):
+        def side_effect(method, url, params=None, **kwargs):
+            if method != 'get':
+                return mock.Mock(status_code=204, history=[], content=b'')
+
+            content = b'{"issues": [{"id": 1}]}' if url.endswith('/issues.json') else b'{"issue": {"id": 1}}'
+            return mock.Mock(status_code=200, history=[], headers={}, content=content,
+                             **{'json.return_value': json.loads(content)})
+
+        self.set_patch_side_effect(side_effect)
+        redmine = Redmine(self.url, cache=True)
+        redmine.issue.get(1)
+        list(redmine.issue.filter(project_id=1))
+        redmine.issue.get(1)
+        list(redmine.issue.filter(project_id=1))
+        self.assertEqual(self.patch_requests.call_count, 2)
+        redmine.issue.update(1, subject='Foo')
+        self.assertEqual(len(redmine.engine.cache), 0)
+        redmine.issue.get(1)
+        list(redmine.issue.filter(project_id=1))
+        self.assertEqual(self.patch_requests.call_count, 5)
+
+    @mock.patch('redminelib.engines.base.time.time')
+    def test_cache_revalidates_expired_responses(self, patch_time):
+        patch_time.return_value = 1000
+        self.response.content = b'{"roles": []}'
+        self.response.json.return_value = {'roles': []}
+        self.response.headers = {'ETag': 'W/"abc"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+        redmine = Redmine(self.url, cache=True, cache_ttl=10)
+        redmine.engine.request('get', self.url)
+        patch_time.return_value = 1011
+        self.response.status_code = 304
+        self.response.content = b''
+        self.assertEqual(redmine.engine.request('get', self.url), {'roles': []})
+        self.assertEqual(self.patch_requests.call_args[1]['headers'], {
+            'If-None-Match': 'W/"abc"', 'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+        patch_time.return_value = 1020
+        self.assertEqual(redmine.engine.request('get', self.url), {'roles': []})
+        self.assertEqual(self.patch_requests.call_count, 2)
+        patch_time.return_value = 1030
+        self.response.status_code = 200
+        self.response.content = b'{"roles": [{"id": 1}]}'
+        self.response.json.return_value = {'roles': [{'id': 1}]}
+        self.assertEqual(redmine.engine.request('get', self.url), {'roles': [{'id': 1}]})
+        self.assertEqual(redmine.engine.request('get', self.url), {'roles': [{'id': 1}]})
+        self.assertEqual(self.patch_requests.call_count, 3)
+
+    def test_memory_cache_evicts_least_recently_used(self):
+        cache = engines.MemoryCache(maxsize=2)
+        cache.set('foo', 1)
+        cache.set('bar', 2)
+        cache.get('foo')
+        cache.set('baz', 3)
+        self.assertEqual((cache.get('foo'), cache.get('bar'), cache.get('baz')), (1, None, 3))
+        cache.delete('foo')
+        self.assertEqual(len(cache), 1)
+        cache.set('group.foo', 1)
+        cache.delete_group('group')
+        self.assertEqual(len(cache), 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_file_cache(self):
+        import tempfile
+        with tempfile.TemporaryDirectory() as path:
+            cache = engines.FileCache(path)
+            self.assertIsNone(cache.get('foo'))
+            cache.set('foo', {'content': b'{"foo": "bar"}', 'validators': {}, 'expires': 10})
+            self.assertEqual(engines.FileCache(path).get('foo'),
+                             {'content': b'{"foo": "bar"}', 'validators': {}, 'expires': 10})
+            cache.delete('foo')
+            cache.delete('foo')
+            self.assertIsNone(cache.get('foo'))
+            cache.set('bar', {'content': b'', 'validators': {}, 'expires': 10})
+            cache.set('group.foo', {'content': b'', 'validators': {}, 'expires': 10})
+            cache.delete_group('group')
+            self.assertIsNone(cache.get('group.foo'))
+            self.assertIsNotNone(cache.get('bar'))
+            cache.clear()
+            self.assertIsNone(cache.get('bar'))
+
+    def test_json_backend_options(self):
+        self.assertIsNone(self.redmine.engine.json_backend)
+        self.assertEqual(Redmine(self.url, json_backend='json').engine.json_backend.name, 'json')
+        self.assertIn(Redmine(self.url, json_backend='auto').engine.json_backend.name,
+                      ('orjson', 'ujson', 'simdjson', 'json'))
+        self.assertRaises(exceptions.JSONBackendError, lambda: Redmine(self.url, json_backend='foo'))
+
+    @mock.patch('importlib.import_module', mock.Mock(side_effect=ImportError))
+    def test_json_backend_is_not_installed(self):
+        self.assertRaises(exceptions.JSONBackendError, lambda: Redmine(self.url, json_backend='orjson'))
+
+    def test_json_backend_decodes_response_content(self):
+        backend = engines.JSONBackend('foo', mock.Mock(return_value={'success': True}), mock.Mock(return_value=b'{}'))
+        redmine = Redmine(self.url, json_backend=backend)
+        self.response.content = b'{"success": true}'
+        self.assertEqual(redmine.engine.request('get', self.url), {'success': True})
+        backend.loads.assert_called_once_with(b'{"success": true}')
+        self.response.json.assert_not_called()
+        redmine.engine.request('post', self.url, data={'foo': 'bar'})
+        backend.dumps.assert_called_once_with({'foo': 'bar'})
+        self.assertEqual(self.patch_requests.call_args[1]['data'], b'{}')
+
+    def test_json_backends(self):
+        from redminelib.engines import serializers
+        for name in serializers.BACKENDS:
+            try:
+                backend = engines.get_json_backend(name)
+            except exceptions.JSONBackendError:
+                continue
+            self.assertEqual(backend.loads(b'{"foo": [1, "\\u0444"]}'), {'foo': [1, '\u0444']})
+            self.assertEqual(json.loads(backend.dumps({'foo': [1, '\u0444']})), {'foo': [1, '\u0444']})
+
+    def test_json_backend_decode_error(self):
+        self.response.content = b'foo'
+        redmine = Redmine(self.url, json_backend='auto')
+        self.assertRaises(exceptions.JSONDecodeError, lambda: redmine.engine.request('get', self.url))
+
+
+class ThreadEngineTestCase(BaseRedmineTestCase):
+    def setUp(self):
+        super().setUp()
+        self.redmine = Redmine(self.url, engine=engines.ThreadEngine, workers=4)
+
+    def test_engine_init(self):
+        self.assertEqual(self.redmine.engine.workers, 4)
+        self.assertEqual(self.redmine.engine.pool_maxsize, 4)
+        self.assertEqual(self.redmine.engine.session.get_adapter(self.url)._pool_maxsize, 4)
+        redmine = Redmine(self.url, engine=engines.ThreadEngine, workers=2, pool_maxsize=8)
+        self.assertEqual(redmine.engine.session.get_adapter(self.url)._pool_maxsize, 8)
+
+    def test_bulk_request_keeps_offset_order(self):
+        self.set_patch_side_effect(lambda method, url, params=None, **kwargs: self.paging_response(params, 350))
+        issues, total_count = self.redmine.engine.bulk_request('get', self.url, 'issues')
+        self.assertEqual(total_count, 350)
+        self.assertEqual([issue['id'] for issue in issues], list(range(350)))
+        self.assertEqual(self.patch_requests.call_count, 4)
+
+    def test_multi_request_keeps_order(self):
+        import time
+
+        def side_effect(method, url, params=None, **kwargs):
+            time.sleep(0.01 * (3 - params['id']))  # later requests finish first
+            return mock.Mock(status_code=200, history=[], **{'json.return_value': {'id': params['id']}})
+
+        self.set_patch_side_effect(side_effect)
+        requests = [(self.url, {'id': i}) for i in range(3)]
+        self.assertEqual(self.redmine.engine.multi_request('get', requests), [{'id': 0}, {'id': 1}, {'id': 2}])
+        self.assertEqual(Redmine(self.url).engine.multi_request('get', requests, workers=3)[2], {'id': 2})
+        self.assertEqual(self.patch_requests.call_count, 6)
+
+
+class AsyncEngineTestCase(BaseRedmineTestCase):
+    def setUp(self):
+        super().setUp()
+        self.redmine = Redmine(self.url, engine=engines.AsyncEngine, workers=2, key='123', requests={'timeout': (3, 5)})
+        self.async_request = mock.patch('httpx.AsyncClient.request', side_effect=self.respond).start()
+
+    async def respond(self, method, url, **kwargs):
+        return self.response
+
+    def test_engine_init(self):
+        self.assertEqual(self.redmine.engine.workers, 2)
+        self.assertIsNone(self.redmine.engine._async_session)
+
+    def test_connection_pool_options(self):
+        async def get_pool():
+            return self.redmine.engine.async_session._transport._pool
+
+        pool = asyncio.run(get_pool())
+        self.assertEqual((pool._max_connections, pool._max_keepalive_connections), (100, 10))
+        self.redmine = Redmine(self.url, engine=engines.AsyncEngine, pool_maxsize=5, keep_alive=False)
+        pool = asyncio.run(get_pool())
+        self.assertEqual((pool._max_connections, pool._max_keepalive_connections), (50, 0))
+
+    def test_successful_response(self):
+        self.response.json.return_value = {'success': True}
+        self.assertEqual(asyncio.run(self.redmine.engine.arequest('get', self.url))['success'], True)
+        method, url = self.async_request.call_args[0]
+        kwargs = self.async_request.call_args[1]
+        self.assertEqual(method, 'GET')
+        self.assertEqual(kwargs['headers']['X-Redmine-API-Key'], '123')
+        self.assertEqual(kwargs['timeout'].connect, 3)
+        self.assertEqual(kwargs['timeout'].read, 5)
+
+    def test_request_with_data(self):
+        self.response.content = ''
+        self.assertEqual(asyncio.run(self.redmine.engine.arequest('put', self.url, data={'foo': 'bar'})), True)
+        kwargs = self.async_request.call_args[1]
+        self.assertEqual(kwargs['content'], '{"foo": "bar"}')
+        self.assertEqual(kwargs['headers']['Content-Type'], 'application/json')
+
+    def test_error_response(self):
+        self.response.status_code = 404
+        self.assertRaises(exceptions.ResourceNotFoundError,
+                          lambda: asyncio.run(self.redmine.engine.arequest('get', self.url)))
+
+    def test_bulk_request_keeps_offset_order(self):
+        async def respond(method, url, params=None, **kwargs):
+            offset = params['offset']
+            await asyncio.sleep(0.01 * (3 - offset // 100))  # later pages finish first
+            return self.paging_response(params, 350)
+
+        self.async_request.side_effect = respond
+        issues, total_count = asyncio.run(self.redmine.engine.abulk_request('get', self.url, 'issues'))
+        self.assertEqual(total_count, 350)
+        self.assertEqual([issue['id'] for issue in issues], list(range(350)))
+        self.assertEqual(self.async_request.call_count, 4)
+
+    def test_bulk_request_adapts_chunk(self):
+        async def respond(method, url, params=None, **kwargs):
+            return self.paging_response(params, 700, max_limit=200)
+
+        self.async_request.side_effect = respond
+        redmine = Redmine(self.url, engine=engines.AsyncEngine, min_chunk=50, max_chunk=1000)
+        issues, total_count = asyncio.run(redmine.engine.abulk_request('get', self.url, 'issues'))
+        self.assertEqual([issue['id'] for issue in issues], list(range(700)))
+        self.assertEqual(redmine.engine.server_chunk, 200)
+        self.assertEqual([call[1]['params']['limit'] for call in self.async_request.call_args_list][0], 1000)
+        self.assertLessEqual(max(call[1]['params']['limit'] for call in self.async_request.call_args_list[1:]), 200)
+
+    def test_async_session_is_bound_to_event_loop(self):
+        async def get_session():
+            return self.redmine.engine.async_session, self.redmine.engine.async_session
+
+        first, second = asyncio.run(get_session())
+        self.assertIs(first, second)
+        self.assertIsNot(asyncio.run(get_session())[0], first)
+        asyncio.run(self.redmine.engine.aclose())
+        self.assertIsNone(self.redmine.engine._async_session)
+
+    def test_async_session_is_closed_with_event_loop(self):
+        async def get_session():
+            return self.redmine.engine.async_session
+
+        first = asyncio.run(get_session())
+        self.assertTrue(first.is_closed)
+        loop = asyncio.new_event_loop()
+        second = loop.run_until_complete(get_session())
+        self.assertIsNot(asyncio.run(get_session()), second)
+        self.assertFalse(second.is_closed)
+        loop.run_until_complete(asyncio.sleep(0))
+        self.assertTrue(second.is_closed)
+        loop.close()
+
+    def test_session_reuses_async_session(self):
+        async def get_sessions():
+            with self.redmine.session(workers=5) as redmine:
+                child = redmine.engine.async_session
+
+            with self.redmine.session(requests={'verify': False}) as redmine:
+                other = redmine.engine.async_session
+                await redmine.engine.aclose()
+
+            return self.redmine.engine.async_session, child, other
+
+        parent, child, other = asyncio.run(get_sessions())
+        self.assertIs(child, parent)
+        self.assertIsNot(other, parent)
+        self.assertTrue(other.is_closed)
+
+    def test_engine_is_picklable(self):
+        import pickle
+        asyncio.run(self.redmine.engine.arequest('get', self.url))
+        redmine = pickle.loads(pickle.dumps(self.redmine))
+        self.assertIsNone(redmine.engine._async_session)
+        self.assertEqual(redmine.engine.requests['headers']['X-Redmine-API-Key'], '123')
+
+    def test_retries_transient_errors(self):
+        import httpx
+        delays = []
+
+        async def sleep(delay):
+            delays.append(delay)
+
+        mock.patch('redminelib.engines.aio.asyncio.sleep', sleep).start()
+        failed = mock.Mock(status_code=502, history=[], headers={}, aclose=lambda: sleep(None))
+        responses = iter([httpx.ConnectError('foo'), failed, self.response])
+
+        async def respond(method, url, **kwargs):
+            response = next(responses)
+
+            if isinstance(response, Exception):
+                raise response
+
+            return response
+
+        self.async_request.side_effect = respond
+        self.response.json.return_value = {'success': True}
+        self.redmine.engine.retry = engines.Retry(backoff_factor=1, jitter=0)
+        self.assertEqual(asyncio.run(self.redmine.engine.arequest('get', self.url))['success'], True)
+        self.assertEqual(self.async_request.call_count, 3)
+        self.assertEqual(delays, [1, None, 2])
+
+    def test_rate_limiter_limits_requests_in_flight(self):
+        in_flight = [0]
+
+        async def respond(method, url, **kwargs):
+            in_flight.append(in_flight[-1] + 1)
+            await asyncio.sleep(0.01)
+            in_flight.append(in_flight[-1] - 1)
+            return self.response
+
+        async def request_all():
+            return await asyncio.gather(*(self.redmine.engine.arequest('get', self.url) for _ in range(6)))
+
+        self.async_request.side_effect = respond
+        self.redmine = Redmine(self.url, engine=engines.AsyncEngine, max_in_flight=2)
+        asyncio.run(request_all())
+        asyncio.run(request_all())
+        self.assertEqual(max(in_flight), 2)
+        self.assertEqual(self.async_request.call_count, 12)
+
+    def test_cache_returns_cached_responses(self):
+        self.response.content = b'{"success": true}'
+        self.response.json.return_value = {'success': True}
+        self.response.headers = {}
+        self.redmine.engine.cache = engines.MemoryCache()
+        self.assertEqual(asyncio.run(self.redmine.engine.arequest('get', self.url)), {'success': True})
+        self.assertEqual(asyncio.run(self.redmine.engine.arequest('get', self.url)), {'success': True})
+        self.assertEqual(self.async_request.call_count, 1)
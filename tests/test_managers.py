@@ -1,3 +1,4 @@
+import asyncio
 import warnings
 
 from . import mock, BaseRedmineTestCase
@@ -44,6 +45,25 @@ class ResourceManagerTestCase(BaseRedmineTestCase):
         self.assertEqual(resourceset[1].identifier, 'bar')
         self.assertEqual(resourceset[1].id, 2)
 
+    def test_nested_resources_share_manager(self):
+        issues = self.redmine.issue.to_resource_set([
+            {'id': 1, 'project': {'id': 1}, 'author': {'id': 1}, 'custom_fields': [{'id': 1, 'value': 'foo'}]},
+            {'id': 2, 'project': {'id': 2}, 'author': {'id': 2}, 'custom_fields': [{'id': 1, 'value': 'bar'}]},
+        ])
+        self.assertIs(issues[0].project.manager, issues[1].project.manager)
+        self.assertIs(issues[0].custom_fields.manager, issues[1].custom_fields.manager)
+        self.assertIsNot(issues[0].project.manager, issues[0].author.manager)
+        self.assertIs(issues[1].author.manager.resource_class, resources.User)
+        self.assertEqual(issues[1].project.manager.params, {})
+        self.assertIsNot(issues.manager.new_manager('Project'), issues[0].project.manager)
+
+    def test_resource_name_conversion_is_memoized(self):
+        from redminelib import utilities
+        self.assertEqual(utilities.to_resource_name('time_entry'), 'TimeEntry')
+        hits = utilities.to_resource_name.cache_info().hits
+        self.assertIsInstance(self.redmine.time_entry, managers.ResourceManager)
+        self.assertEqual(utilities.to_resource_name.cache_info().hits, hits + 1)
+
     def test_get_single_resource(self):
         self.response.json.return_value = responses['project']['get']
         project = self.redmine.project.get('foo')
@@ -63,6 +83,47 @@ class ResourceManagerTestCase(BaseRedmineTestCase):
         self.assertEqual(enumeration.id, 1)
         self.assertEqual(enumeration.name, 'Foo')
 
+    def test_get_many_resources_via_filter(self):
+        self.response.json.return_value = {'issues': [{'id': 3}, {'id': 1}]}
+        issues = self.redmine.issue.get_many([1, 2, 3, 1], chunk=2, workers=2)
+        self.assertEqual([issue.id for issue in issues], [1, 3])
+        self.assertEqual(issues.missing_ids, [2])
+        self.assertEqual(self.patch_requests.call_count, 2)
+        self.assertEqual(sorted(call[1]['params']['issue_id'] for call in self.patch_requests.call_args_list),
+                         ['1,2', '3'])
+        self.assertEqual(self.patch_requests.call_args[1]['params']['status_id'], '*')
+
+    def test_get_many_resources_via_get(self):
+        def side_effect(method, url, params=None, **kwargs):
+            if url.endswith('/bar.json'):
+                return mock.Mock(status_code=404, history=[])
+
+            return mock.Mock(status_code=200, history=[], **{'json.return_value': {
+                'project': {'id': 1, 'identifier': url.split('/')[-1][:-5]}}})
+
+        self.set_patch_side_effect(side_effect)
+        projects = self.redmine.project.get_many(['foo', 'bar'], workers=2)
+        self.assertEqual([project.identifier for project in projects], ['foo'])
+        self.assertEqual(projects.missing_ids, ['bar'])
+
+    def test_get_many_resources_via_get_removes_duplicates(self):
+        def side_effect(method, url, params=None, **kwargs):
+            project_id = 2 if url.endswith('/bar.json') else 1
+            return mock.Mock(status_code=200, history=[], **{'json.return_value': {
+                'project': {'id': project_id, 'identifier': 'bar' if project_id == 2 else 'foo'}}})
+
+        self.set_patch_side_effect(side_effect)
+        projects = self.redmine.project.get_many(['foo', 'bar', 1, '1'], workers=2)
+        self.assertEqual([project.id for project in projects], [1, 2])
+        self.assertEqual(projects.missing_ids, [])
+        self.assertEqual(self.patch_requests.call_count, 3)
+
+    def test_get_many_resources_via_all(self):
+        self.response.json.return_value = responses['tracker']['all']
+        trackers = self.redmine.tracker.get_many([2, '1', 999])
+        self.assertEqual([tracker.id for tracker in trackers], [2, 1])
+        self.assertEqual(trackers.missing_ids, [999])
+
     def test_get_unicode_resource(self):
         unicode_name = b'\xcf\x86oo'.decode('utf-8')
         self.response.json.return_value = {'project': {'name': unicode_name, 'identifier': unicode_name, 'id': 1}}
@@ -186,6 +247,46 @@ class ResourceManagerTestCase(BaseRedmineTestCase):
         with self.redmine.session(return_response=False):
             self.assertEqual(self.redmine.user.delete(1), None)
 
+    def test_awaitable_get_single_resource(self):
+        self.response.json.return_value = responses['project']['get']
+        project = asyncio.run(self.redmine.project.aget('foo'))
+        self.assertEqual(project.name, 'Foo')
+        self.assertEqual(project.identifier, 'foo')
+        self.assertEqual(project.id, 1)
+
+    def test_awaitable_get_single_resource_via_all(self):
+        self.response.json.return_value = responses['tracker']['all']
+        tracker = asyncio.run(self.redmine.tracker.aget(1))
+        self.assertEqual(tracker.id, 1)
+        self.assertEqual(tracker.name, 'Foo')
+
+    def test_awaitable_all_and_filter_return_evaluated_resource_set(self):
+        self.response.json.return_value = responses['project']['all']
+        projects = asyncio.run(self.redmine.project.aall())
+        self.assertIsNotNone(projects._resources)
+        self.assertEqual([project.id for project in projects], [1, 2])
+        self.response.json.return_value = responses['issue']['filter']
+        issues = asyncio.run(self.redmine.issue.afilter(project_id='foo'))
+        self.assertIsNotNone(issues._resources)
+        self.assertEqual(issues[0].id, 1)
+
+    def test_awaitable_create_update_delete_resource(self):
+        self.response.status_code = 201
+        self.response.json.return_value = responses['user']['get']
+        user = asyncio.run(self.redmine.user.acreate(firstname='John', lastname='Smith'))
+        self.assertEqual(user.firstname, 'John')
+        self.response.status_code = 200
+        self.response.content = ''
+        self.assertEqual(asyncio.run(self.redmine.user.aupdate(1, firstname='Bar')), True)
+        self.assertEqual(asyncio.run(self.redmine.user.adelete(1)), True)
+
+    def test_awaitable_methods_raise_the_same_exceptions(self):
+        self.assertRaises(exceptions.ResourceBadMethodError, lambda: asyncio.run(self.redmine.query.acreate()))
+        self.assertRaises(exceptions.ResourceBadMethodError, lambda: asyncio.run(self.redmine.query.aupdate(1)))
+        self.assertRaises(exceptions.ResourceBadMethodError, lambda: asyncio.run(self.redmine.query.adelete(1)))
+        self.response.status_code = 404
+        self.assertRaises(exceptions.ResourceNotFoundError, lambda: asyncio.run(self.redmine.project.aget(1)))
+
     def test_resource_get_method_unsupported_exception(self):
         self.assertRaises(exceptions.ResourceBadMethodError, lambda: self.redmine.issue_journal.get(1))
 
@@ -63,6 +63,70 @@ class RedmineTestCase(BaseRedmineTestCase):
         self.assertRaises(KeyError, lambda: self.redmine.engine.requests['verify'])
         self.assertRaises(KeyError, lambda: self.redmine.engine.requests['timeout'])
 
+    def test_identity_map(self):
+        import gc
+        import pickle
+        self.assertIsNone(self.redmine.identity_map)
+        self.redmine = Redmine(self.url, identity_map=True)
+        issue = {'id': 1, 'project': {'id': 1, 'name': 'Foo'}}
+        first = self.redmine.issue.to_resource(issue)
+        second = self.redmine.issue.to_resource(dict(issue))
+        self.assertIs(first.project, second.project)
+        self.assertIs(first.project, self.redmine.time_entry.to_resource({'id': 1, 'project': {'id': 1}}).project)
+        self.assertEqual(len(self.redmine.identity_map), 1)
+        del first, second
+        gc.collect()
+        self.assertEqual(len(self.redmine.identity_map), 0)
+        self.redmine.issue.to_resource(issue).project
+        self.assertEqual(len(pickle.loads(pickle.dumps(self.redmine)).identity_map), 0)
+
+    def test_session_reuses_connection_pool(self):
+        session = self.redmine.engine.session
+        with self.redmine.session(key='opa', requests={'stream': True}):
+            self.assertIs(self.redmine.engine.session, session)
+            self.redmine.engine.request('get', self.url, headers={'foo': 'bar'})
+            kwargs = self.patch_requests.call_args[1]
+            self.assertEqual(kwargs['headers'], {'X-Redmine-API-Key': 'opa', 'foo': 'bar'})
+            self.assertEqual(kwargs['stream'], True)
+        self.assertIs(self.redmine.engine.session, session)
+        self.redmine.engine.request('get', self.url)
+        self.assertEqual(self.patch_requests.call_args[1]['headers'], {})
+        self.assertNotIn('stream', self.patch_requests.call_args[1])
+
+    def test_session_with_pool_options_creates_connection_pool(self):
+        session = self.redmine.engine.session
+        with mock.patch('requests.Session.close') as close, self.redmine.session(pool_maxsize=50):
+            self.assertIsNot(self.redmine.engine.session, session)
+            self.assertEqual(self.redmine.engine.session.get_adapter(self.url)._pool_maxsize, 50)
+            self.assertEqual(self.redmine.engine.pool_connections, 10)
+            self.assertEqual(close.call_count, 0)
+        self.assertEqual(close.call_count, 1)
+        self.assertIs(self.redmine.engine.session, session)
+
+    def test_session_shares_rate_limiter(self):
+        limiter = self.redmine.engine.limiter
+        with self.redmine.session(return_response=False):
+            self.assertIs(self.redmine.engine.limiter, limiter)
+        with self.redmine.session(max_in_flight=2):
+            self.assertIsNot(self.redmine.engine.limiter, limiter)
+            self.assertEqual(self.redmine.engine.limiter.max_in_flight, 2)
+
+    def test_session_keeps_engine_options(self):
+        self.redmine = Redmine(self.url, retries=3, chunk=50, prefetch=2, cache=True, cache_ttl=10)
+        with self.redmine.session(impersonate='jsmith'):
+            self.assertEqual(self.redmine.engine.retry.total, 3)
+            self.assertEqual(self.redmine.engine.chunk, 50)
+            self.assertEqual(self.redmine.engine.max_chunk, 50)
+            self.assertEqual(self.redmine.engine.prefetch, 2)
+            self.assertEqual(self.redmine.engine.cache_ttl, 10)
+        with self.redmine.session(chunk=20, retries=0):
+            self.assertEqual((self.redmine.engine.min_chunk, self.redmine.engine.max_chunk), (20, 20))
+            self.assertEqual(self.redmine.engine.retry.total, 0)
+        self.redmine = Redmine(self.url, engine=engines.ThreadEngine, workers=3, min_chunk=10, max_chunk=200)
+        with self.redmine.session(key='opa'):
+            self.assertEqual(self.redmine.engine.workers, 3)
+            self.assertEqual((self.redmine.engine.min_chunk, self.redmine.engine.max_chunk), (10, 200))
+
     @mock.patch('os.path.isfile', mock.Mock())
     @mock.patch('os.path.getsize', mock.Mock())
     @mock.patch('redminelib.open', mock.mock_open(), create=True)
@@ -167,6 +167,23 @@ class StandardResourcesTestCase(BaseRedmineTestCase):
         self.assertEqual(encoded['created_at'], datetime(
             2014, 3, 10, 4, 2, 2, tzinfo=timezone(timedelta(seconds=28800))))
 
+    def test_bulk_encode_skips_strings_which_are_not_dates(self):
+        from datetime import date
+        decoded = {'foo': '2014-03-09 is a date', 'bar': '2014-03-09T20:02:02', 'baz': '2014-13-09', 'qux': 5,
+                   'quux': '2014-03-09T20:02:02+01', 'corge': '2014-03-09T20-02-02Z', 'grault': '2014-03-09'}
+        encoded = self.redmine.project.resource_class.bulk_encode(decoded, self.redmine.project)
+        self.assertEqual(encoded, dict(decoded, grault=date(2014, 3, 9)))
+
+    def test_bulk_encode_with_custom_formats(self):
+        from datetime import date, datetime
+        self.redmine.date_format = '%d.%m.%Y'
+        self.redmine.datetime_format = '%d.%m.%Y %H:%M'
+        decoded = {'start_date': '09.03.2014', 'created_at': '09.03.2014 20:02', 'foo': '2014-03-09'}
+        encoded = self.redmine.project.resource_class.bulk_encode(decoded, self.redmine.project)
+        self.assertEqual(encoded['start_date'], date(2014, 3, 9))
+        self.assertEqual(encoded['created_at'], datetime(2014, 3, 9, 20, 2))
+        self.assertEqual(encoded['foo'], '2014-03-09')
+
     def test_resource_dict_is_converted_to_resource_object(self):
         self.response.json.return_value = responses['issue']['get']
         issue = self.redmine.issue.get(1)
@@ -219,6 +236,25 @@ class StandardResourcesTestCase(BaseRedmineTestCase):
         self.assertEqual(project.id, unpickled_project.id)
         self.assertEqual(project.name, unpickled_project.name)
 
+    def test_resource_caches_are_created_on_first_use(self):
+        self.response.json.return_value = responses['issue']['get']
+        issue = self.redmine.issue.get(1)
+        self.assertEqual(set(vars(issue)), {'manager', '_decoded_attrs'})
+        self.assertIs(issue._decoded_attrs, issue.raw())
+        self.assertEqual(issue.subject, 'Foo')
+        self.assertEqual(issue._encoded_attrs, {'subject': 'Foo'})
+        self.assertNotIn('_changes', vars(issue))
+        issue.subject = 'Bar'
+        self.assertEqual(issue._changes, {'subject': 'Bar'})
+
+    def test_relations_and_includes_are_readonly(self):
+        issue = self.redmine.issue.new()
+        self.assertRaises(exceptions.ReadonlyAttrError, lambda: setattr(issue, 'relations', []))
+        self.response.json.return_value = responses['issue']['get']
+        issue = self.redmine.issue.get(1)
+        self.assertRaises(exceptions.ReadonlyAttrError, lambda: setattr(issue, 'journals', []))
+        self.assertNotIn('_create_readonly', vars(issue))
+
     def test_attach_attributes_through_registry(self):
         class BarResource(resources.BaseResource):
             _attach_includes = {'User': 'bars'}
@@ -243,6 +279,30 @@ class StandardResourcesTestCase(BaseRedmineTestCase):
         time_entry = self.redmine.time_entry.get(1)
         self.assertIn('bars', time_entry._relations)
         self.assertIn(('bars', 'BarResource'), time_entry._resource_set_map.items())
+        self.assertEqual(user._getters['bars'], 'include')
+        self.assertEqual(issue._getters['bars'], 'relation')
+        self.assertEqual(time_entry._encoders['bars'], ('resource_set', 'BarResource'))
+
+    def test_dispatch_tables_are_compiled(self):
+        issue = resources.Issue
+        self.assertEqual(issue._encoders['subject'], ('unconvertible', None))
+        self.assertEqual(issue._encoders['author'], ('resource', 'User'))
+        self.assertEqual(issue._encoders['custom_fields'], ('resource_set', 'CustomField'))
+        self.assertEqual(issue._encoders['parent'], ('resource', 'Issue'))
+        self.assertEqual(issue._getters['relations'], 'relation')
+        self.assertEqual(issue._getters['journals'], 'include')
+        self.assertIn('watcher_user_ids', issue._custom_settable)
+        self.assertIn('url', issue._settable)
+
+        class BaseDispatchResource(resources.BaseResource):
+            _resource_map = {'foo': 'User'}
+
+        class DispatchResource(BaseDispatchResource):
+            pass
+
+        resources.base.Registrar.update_cls_attr(BaseDispatchResource, '_resource_map', {'bar': 'Project'})
+        self.assertEqual(DispatchResource._encoders['bar'], ('resource', 'Project'))
+        self.assertEqual(DispatchResource._encoders['parent'], ('resource', 'DispatchResource'))
 
     def test_attach_attributes_through_registry_before_resource_was_added(self):
         resources.registry['BazResource'] = {'attach_relations': type('_', (), {'keys': lambda: set()})}
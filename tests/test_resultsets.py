@@ -1,6 +1,11 @@
-from . import mock, BaseRedmineTestCase
+import copy
+import asyncio
+import unittest
+import importlib.util
 
-from redminelib import exceptions
+from . import mock, BaseRedmineTestCase, Redmine
+
+from redminelib import engines, exceptions
 
 response = {
     'issues': [
@@ -60,6 +65,35 @@ class ResultSetTestCase(BaseRedmineTestCase):
         issue = self.redmine.issue.get(1)
         self.assertEqual(issue.custom_fields.total_count, 1)
 
+    def test_count(self):
+        self.response.json.return_value = {'total_count': 30, 'limit': 1, 'offset': 0, 'issues': [{'id': 1}]}
+        issues = self.redmine.issue.all()
+        self.assertEqual(issues.count(), 30)
+        self.assertEqual(issues.count(), 30)
+        self.assertEqual(issues.total_count, 30)
+        self.assertEqual(self.patch_requests.call_count, 1)
+        self.assertEqual(self.patch_requests.call_args[1]['params']['limit'], 1)
+        self.assertIsNone(issues._resources)
+        self.assertEqual(self.redmine.issue.all()[10:5].count(), 5)
+        self.assertEqual(self.redmine.issue.all()[28:5].count(), 2)
+        self.assertEqual(self.redmine.issue.filter(offset=40).count(), 0)
+
+    def test_count_without_paging(self):
+        self.response.json.return_value = {'trackers': [{'id': 1}, {'id': 2}, {'id': 3}]}
+        trackers = self.redmine.tracker.all()[1:]
+        self.assertEqual(trackers.count(), 2)
+        self.assertEqual(trackers.total_count, 3)
+        self.assertEqual([tracker.id for tracker in trackers], [2, 3])
+        self.assertEqual(trackers.count(), 2)
+        self.assertEqual(self.patch_requests.call_count, 1)
+
+    def test_count_requirements_exception(self):
+        self.response.status_code = 404
+        self.assertRaises(exceptions.ResourceNotFoundError, lambda: self.redmine.issue.all().count())
+
+        with mock.patch.object(self.redmine.issue.resource_class, 'requirements', ['foo plugin']):
+            self.assertRaises(exceptions.ResourceRequirementsError, lambda: self.redmine.issue.all().count())
+
     def test_total_count_raise_exception_if_not_evaluated(self):
         self.assertRaises(exceptions.ResultSetTotalCountError, lambda: self.redmine.issue.all().total_count)
 
@@ -82,9 +116,233 @@ class ResultSetTestCase(BaseRedmineTestCase):
         self.assertEqual(issues[1].subject, 'Bar')
         self.assertEqual(issues[1].id, 2)
 
+    def test_supports_async_iteration(self):
+        async def collect(resourceset):
+            return [resource async for resource in resourceset]
+
+        issues = asyncio.run(collect(self.redmine.issue.all()))
+        self.assertEqual([issue.id for issue in issues], [1, 2, 3])
+        self.assertEqual(issues[0].subject, 'Foo')
+
+    def test_async_iteration_of_sliced_resultset(self):
+        async def collect(resourceset):
+            return [resource async for resource in resourceset]
+
+        self.response.json.return_value = {
+            'total_count': 3, 'limit': 2, 'offset': 1, 'issues': response['issues'][1:3]}
+        issues = asyncio.run(collect(self.redmine.issue.all()[1:2]))
+        self.assertEqual([issue.id for issue in issues], [2, 3])
+
+    def test_iterator_requests_pages_lazily(self):
+        self.set_patch_side_effect(lambda method, url, params=None, **kwargs: self.paging_response(params, 5))
+        issues = self.redmine.issue.all()
+        iterator = issues.iterator(chunk_size=2)
+        self.assertEqual(next(iterator).id, 0)
+        self.assertEqual(self.patch_requests.call_count, 1)
+        self.assertEqual(next(iterator).id, 1)
+        self.assertEqual(self.patch_requests.call_count, 1)
+        self.assertEqual(next(iterator).id, 2)
+        self.assertEqual(self.patch_requests.call_count, 2)
+        self.assertEqual([issue.id for issue in iterator], [3, 4])
+        self.assertEqual(self.patch_requests.call_count, 3)
+        self.assertIsNone(issues._resources)
+        self.assertEqual(issues.total_count, 5)
+
+    def test_iterator_respects_limit_and_offset(self):
+        self.set_patch_side_effect(lambda method, url, params=None, **kwargs: self.paging_response(params, 10))
+        self.assertEqual([issue.id for issue in self.redmine.issue.all()[3:5].iterator(chunk_size=2)], [3, 4, 5, 6, 7])
+        self.assertEqual([issue.id for issue in self.redmine.issue.all(offset=8).iterator(chunk_size=3)], [8, 9])
+
+    def test_iterator_with_prefetch(self):
+        self.set_patch_side_effect(
+            lambda method, url, params=None, **kwargs: self.paging_response(params, 9, max_limit=2))
+        self.assertEqual([issue.id for issue in self.redmine.issue.all().iterator(chunk_size=5, prefetch=2)],
+                         list(range(9)))
+        self.assertEqual(self.patch_requests.call_count, 5)
+        self.assertEqual([issue.id for issue in self.redmine.issue.all()[1:6].iterator(prefetch=3)],
+                         [1, 2, 3, 4, 5, 6])
+
+    def test_iterator_with_prefetch_stops_early(self):
+        self.set_patch_side_effect(lambda method, url, params=None, **kwargs: self.paging_response(params, 1000))
+        self.redmine.engine.prefetch = 2
+        iterator = self.redmine.issue.all().iterator(chunk_size=10)
+        self.assertEqual([next(iterator).id for _ in range(15)], list(range(15)))
+        iterator.close()
+        self.assertLessEqual(self.patch_requests.call_count, 5)
+
+    def test_iterator_mimic(self):
+        self.assertEqual([issue.id for issue in self.redmine.issue.all()[1:3].iterator()], [2, 3])
+
+    def test_iterator_of_evaluated_resultset(self):
+        issues = self.redmine.issue.all()
+        list(issues)
+        self.assertEqual([issue.id for issue in issues.iterator()], [1, 2, 3])
+        self.assertEqual(self.patch_requests.call_count, 1)
+
+    def test_prefetch(self):
+        def side_effect(method, url, params=None, **kwargs):
+            if '/issues.json' in url:
+                return mock.Mock(status_code=200, history=[], **{'json.return_value': copy.deepcopy(response)})
+
+            issue_id = int(url.split('/')[-1][:-5])
+            return mock.Mock(status_code=200, history=[], **{'json.return_value': {'issue': {
+                'id': issue_id, 'journals': [{'id': issue_id * 10}], 'watchers': None}}})
+
+        self.set_patch_side_effect(side_effect)
+        issues = self.redmine.issue.all().prefetch('journals', 'watchers', 'journals', workers=2)
+        self.assertEqual(self.patch_requests.call_count, 0)
+        self.assertEqual([issue.journals[0].id for issue in issues], [10, 20, 30])
+        self.assertEqual([len(issue.watchers) for issue in issues], [0, 0, 0])
+        self.assertEqual(self.patch_requests.call_args[1]['params'], {'include': 'journals,watchers'})
+        self.assertEqual([issue.journals[0].id for issue in issues.filter(id=2)], [20])
+        self.assertEqual(self.patch_requests.call_count, 4)
+        issues = self.redmine.issue.all().prefetch('journals')[1:]
+        self.assertEqual([issue.journals[0].id for issue in issues], [20, 30])
+        self.assertEqual(self.patch_requests.call_count, 7)
+        issues = self.redmine.issue.all().prefetch('journals')
+        self.assertEqual([issue.journals[0].id for issue in issues.iterator(chunk_size=2)], [10, 20, 30])
+
+    def test_prefetch_only_for_selected_resources(self):
+        def side_effect(method, url, params=None, **kwargs):
+            if '/issues.json' in url:
+                return mock.Mock(status_code=200, history=[], **{'json.return_value': copy.deepcopy(response)})
+
+            issue_id = int(url.split('/')[-1][:-5])
+            return mock.Mock(status_code=200, history=[], **{'json.return_value': {'issue': {
+                'id': issue_id, 'journals': [{'id': issue_id * 10}]}}})
+
+        self.set_patch_side_effect(side_effect)
+        issues = self.redmine.issue.all().prefetch('journals')
+        filtered = issues.filter(subject__contains='Ba')
+        self.assertEqual(self.patch_requests.call_count, 1)
+        self.assertEqual([issue.journals[0].id for issue in filtered], [20, 30])
+        self.assertEqual(self.patch_requests.call_count, 3)
+        self.assertEqual(list(issues.values_list('subject', flat=True)), ['Foo', 'Bar', 'Baz'])
+        self.assertEqual(issues.get(1).journals[0].id, 10)
+        self.assertEqual(self.patch_requests.call_count, 4)
+        self.assertEqual([len(issue['journals']) for issue in issues.values('journals')], [1, 1, 1])
+        self.assertEqual(self.patch_requests.call_count, 4)
+        self.assertEqual(self.redmine.issue.all().prefetch('journals').get(3).journals[0].id, 30)
+        self.assertEqual(self.patch_requests.call_count, 6)
+
+    def test_prefetch_with_async_iteration(self):
+        async def respond(method, url, params=None, **kwargs):
+            if '/issues.json' in url:
+                data = copy.deepcopy(response)
+            elif '/time_entries.json' in url:
+                data = {'time_entries': [{'id': int(params['issue_id']) * 100, 'issue': {'id': params['issue_id']}}]}
+            else:
+                data = {'issue': {'id': int(url.split('/')[-1][:-5]), 'journals': [{'id': 10}]}}
+            return mock.Mock(status_code=200, history=[], **{'json.return_value': data})
+
+        async def collect(resourceset):
+            return [resource async for resource in resourceset]
+
+        async_request = mock.patch('httpx.AsyncClient.request', side_effect=respond).start()
+        self.redmine = Redmine(self.url, engine=engines.AsyncEngine, workers=2)
+        issues = asyncio.run(collect(self.redmine.issue.all().prefetch('journals').prefetch_related('time_entries')))
+        self.assertEqual([issue.journals[0].id for issue in issues], [10, 10, 10])
+        self.assertEqual([issue.time_entries[0].id for issue in issues], [100, 200, 300])
+        self.assertEqual(async_request.call_count, 7)
+        self.assertEqual(self.patch_requests.call_count, 0)
+
+    def test_prefetch_unsupported_include_exception(self):
+        self.assertRaises(exceptions.ResourceSetPrefetchError, lambda: self.redmine.issue.all().prefetch('foo'))
+
+    def test_prefetch_related_multiple_filter(self):
+        def side_effect(method, url, params=None, **kwargs):
+            if '/users.json' in url:
+                data = {'users': [{'id': 1}, {'id': 2}, {'id': 3}]}
+            else:
+                data = {'time_entries': [{'id': 10, 'user': {'id': 1}}, {'id': 30, 'user': {'id': 3}},
+                                         {'id': 11, 'user': {'id': 1}}]}
+            return mock.Mock(status_code=200, history=[], **{'json.return_value': data})
+
+        self.set_patch_side_effect(side_effect)
+        users = self.redmine.user.all().prefetch_related('time_entries')
+        self.assertEqual([[entry.id for entry in user.time_entries] for user in users], [[10, 11], [], [30]])
+        self.assertEqual(self.patch_requests.call_count, 2)
+        self.assertEqual(self.patch_requests.call_args[1]['params']['user_id'], '1|2|3')
+        self.assertEqual([user.time_entries.total_count for user in users], [2, 0, 1])
+        self.assertEqual(users.get(3).time_entries[0].id, 30)
+        self.assertEqual(self.patch_requests.call_count, 2)
+        users = self.redmine.user.all().prefetch_related('time_entries')
+        self.assertEqual([len(user.time_entries) for user in users.iterator(chunk_size=2)], [2, 0, 1])
+
+    def test_prefetch_related_single_filter(self):
+        def side_effect(method, url, params=None, **kwargs):
+            if 'issue_id' not in params:
+                return mock.Mock(status_code=200, history=[], **{'json.return_value': copy.deepcopy(response)})
+
+            return mock.Mock(status_code=200, history=[], **{'json.return_value': {'time_entries': [
+                {'id': params['issue_id'] * 10, 'issue': {'id': params['issue_id']}}]}})
+
+        self.set_patch_side_effect(side_effect)
+        issues = self.redmine.issue.all().prefetch_related('time_entries', workers=2)
+        self.assertEqual([issue.time_entries[0].id for issue in issues], [10, 20, 30])
+        self.assertEqual(self.patch_requests.call_count, 4)
+        self.assertEqual([issue.time_entries[0].id for issue in issues.filter(id=2)], [20])
+        self.assertEqual(self.patch_requests.call_count, 4)
+
+    def test_prefetch_related_only_for_selected_resources(self):
+        def side_effect(method, url, params=None, **kwargs):
+            if 'issue_id' not in params:
+                return mock.Mock(status_code=200, history=[], **{'json.return_value': copy.deepcopy(response)})
+
+            return mock.Mock(status_code=200, history=[], **{'json.return_value': {'time_entries': [
+                {'id': params['issue_id'] * 10, 'issue': {'id': params['issue_id']}}]}})
+
+        self.set_patch_side_effect(side_effect)
+        issues = self.redmine.issue.all().prefetch_related('time_entries')
+        self.assertEqual([issue.time_entries[0].id for issue in issues.filter(subject='Bar')], [20])
+        self.assertEqual(self.patch_requests.call_count, 2)
+        self.assertEqual(list(issues.values_list('id', flat=True)), [1, 2, 3])
+        self.assertEqual(issues.get(3).time_entries[0].id, 30)
+        self.assertEqual(self.patch_requests.call_count, 3)
+
+    def test_prefetch_related_unsupported_relation_exception(self):
+        self.assertRaises(exceptions.ResourceSetPrefetchError,
+                          lambda: self.redmine.issue.all().prefetch_related('journals'))
+
+    def test_share_nested(self):
+        self.response.json.return_value = {'issues': [
+            {'id': 1, 'project': {'id': 1, 'name': 'Foo'}, 'author': {'id': 1}, 'assigned_to': {'id': 1}},
+            {'id': 2, 'project': {'id': 1, 'name': 'Foo'}, 'author': {'id': 2}, 'assigned_to': {'id': 1}},
+        ]}
+        first, second = list(self.redmine.issue.all())
+        self.assertIsNot(first.project, second.project)
+        first, second = list(self.redmine.issue.all().share_nested())
+        self.assertIs(first.project, second.project)
+        self.assertIs(first.author, first.assigned_to)
+        self.assertIs(first.assigned_to, second.assigned_to)
+        self.assertIsNot(first.author, second.author)
+        self.assertIsNot(first.author, first.project)
+        self.assertIsNot(first, second)
+
     def test_supports_len(self):
         self.assertEqual(len(self.redmine.issue.all()), 3)
 
+    def test_len_and_bool_do_not_create_resources(self):
+        issues = self.redmine.issue.all()
+
+        with mock.patch.object(issues.manager, 'to_resource', wraps=issues.manager.to_resource) as to_resource:
+            self.assertEqual(len(issues), 3)
+            self.assertTrue(issues)
+            self.assertEqual(to_resource.call_count, 0)
+            self.assertEqual(len(list(issues)), 3)
+            self.assertEqual(to_resource.call_count, 3)
+
+        self.assertEqual(self.patch_requests.call_count, 1)
+        issues._is_sliced, issues.limit, issues.offset = True, 5, 1
+        self.assertEqual(len(issues), 2)
+        issues.offset = 0
+        self.assertEqual(len(issues), 3)
+        issues.limit, issues.offset = 0, 2
+        self.assertEqual(len(issues), 1)
+        self.assertEqual([issue.id for issue in issues], [3])
+        self.response.json.return_value = {'issues': []}
+        self.assertFalse(self.redmine.issue.all())
+
     def test_get_method_resource_found(self):
         issues = self.redmine.issue.all().get(2)
         self.assertEqual(issues.id, 2)
@@ -93,21 +351,158 @@ class ResultSetTestCase(BaseRedmineTestCase):
         issues = self.redmine.issue.all().get(6)
         self.assertEqual(issues, None)
 
+    def test_get_method_uses_index(self):
+        issues = self.redmine.issue.all()
+        self.assertEqual(issues.get(2).id, 2)
+        self.assertEqual(issues._indexes, {})
+        self.assertEqual(issues.get(3).id, 3)
+        self.assertIsNone(issues.get(6))
+        self.assertIsNone(issues.get([1]))
+        self.assertEqual(issues._indexes, {('id',): {1: [0], 2: [1], 3: [2]}})
+        issues._resources = [{'id': 4}]
+        self.assertEqual(issues._indexes, {})
+        self.assertEqual(issues.get(4).id, 4)
+        self.assertEqual(self.patch_requests.call_count, 1)
+
+    def test_filter_method_uses_index(self):
+        self.response.json.return_value = {'issues': [
+            {'id': 1, 'status': {'id': 1}, 'project': {'id': 1}},
+            {'id': 2, 'status': {'id': 2}, 'project': {'id': 1}},
+            {'id': 3, 'status': {'id': 1}, 'project': {'id': 2}},
+            {'id': 4},
+        ]}
+        issues = self.redmine.issue.all()
+        list(issues)
+        self.assertEqual([issue.id for issue in issues.filter(project__id=1, status__id=1)], [1])
+        self.assertEqual([issue.id for issue in issues.filter(status__id__in=[2, 1])], [1, 2, 3])
+        self.assertEqual([issue.id for issue in issues.filter(status__id__in=[[1]])], [])
+        self.assertEqual(list(issues._indexes), [('project', 'id'), ('status', 'id')])
+        self.assertEqual(issues._indexes[('status', 'id')], {1: [0, 2], 2: [1]})
+        issues._resources[3]['status'] = None
+        issues._resources = issues._resources
+        self.assertRaises(exceptions.ResourceSetFilterLookupError, lambda: issues.filter(status__id=1))
+        self.assertEqual(issues._indexes, {('status', 'id'): None})
+
     def test_filter_method_nonexistant_attributes(self):
         issues = self.redmine.issue.all().filter(id=1, foo__exact=1)
         self.assertEqual(len(issues), 0)
 
     def test_filter_exact_lookup(self):
-        issues = self.redmine.issue.all().filter(id=1, tracker_id__exact=1)
+        issues = self.redmine.issue.all()
+        list(issues)
+        issues = issues.filter(id=1, tracker_id__exact=1)
         self.assertEqual(issues[0].id, 1)
         self.assertEqual(len(issues), 1)
 
     def test_filter_in_lookup(self):
-        issues = self.redmine.issue.all().filter(id__in=(1, 3))
+        issues = self.redmine.issue.all()
+        list(issues)
+        issues = issues.filter(id__in=(1, 3))
         self.assertEqual(issues[0].id, 1)
         self.assertEqual(issues[1].id, 3)
         self.assertEqual(len(issues), 2)
 
+    def test_filter_comparison_lookups(self):
+        from datetime import date, datetime, timezone, timedelta
+        self.response.json.return_value = {'issues': [
+            {'id': 1, 'done_ratio': 10, 'start_date': '2024-01-01', 'created_on': '2024-01-01T10:00:00Z'},
+            {'id': 2, 'done_ratio': 50, 'start_date': '2024-02-01', 'created_on': '2024-02-01T10:00:00Z'},
+            {'id': 3, 'done_ratio': 90, 'start_date': '2024-03-01', 'created_on': '2024-03-01T10:00:00Z'},
+        ]}
+        issues = self.redmine.issue.all()
+        list(issues)
+        self.assertEqual([issue.id for issue in issues.filter(done_ratio__gt=10)], [2, 3])
+        self.assertEqual([issue.id for issue in issues.filter(done_ratio__gte=50, done_ratio__lt=90)], [2])
+        self.assertEqual([issue.id for issue in issues.filter(done_ratio__lte=50)], [1, 2])
+        self.assertEqual([issue.id for issue in issues.filter(done_ratio__range=(10, 50))], [1, 2])
+        self.assertEqual([issue.id for issue in issues.filter(start_date__gte=date(2024, 2, 1))], [2, 3])
+        self.assertEqual([issue.id for issue in issues.filter(
+            created_on__lt=datetime(2024, 2, 1, 12, tzinfo=timezone(timedelta(hours=3))))], [1])
+        self.assertRaises(exceptions.ResourceSetFilterLookupError, lambda: issues.filter(done_ratio__gt='a'))
+        self.assertRaises(exceptions.ResourceSetFilterLookupError, lambda: issues.filter(id__range=1))
+
+    def test_filter_string_and_null_lookups(self):
+        self.response.json.return_value = {'issues': [
+            {'id': 1, 'subject': 'Foo bar', 'tags': ['a', 'b'], 'assigned_to': {'id': 1}},
+            {'id': 2, 'subject': 'Bar', 'tags': ['b'], 'category': None},
+        ]}
+        issues = self.redmine.issue.all()
+        list(issues)
+        self.assertEqual([issue.id for issue in issues.filter(subject__contains='Bar')], [2])
+        self.assertEqual([issue.id for issue in issues.filter(subject__icontains='bar')], [1, 2])
+        self.assertEqual([issue.id for issue in issues.filter(tags__contains='a')], [1])
+        self.assertEqual([issue.id for issue in issues.filter(subject__startswith='Foo')], [1])
+        self.assertEqual([issue.id for issue in issues.filter(assigned_to__isnull=True)], [2])
+        self.assertEqual([issue.id for issue in issues.filter(category__isnull=True)], [1, 2])
+        self.assertEqual([issue.id for issue in issues.filter(assigned_to__id__isnull=False)], [1])
+        self.assertRaises(exceptions.ResourceSetFilterLookupError, lambda: issues.filter(id__startswith='1'))
+        self.assertRaises(exceptions.ResourceSetFilterLookupError, lambda: issues.filter(subject__icontains=1))
+
+    def test_filter_date_pushdown(self):
+        from datetime import date, datetime
+        issues = self.redmine.issue.all().filter(start_date__range=(date(2024, 1, 1), date(2024, 1, 31)),
+                                                 due_date__lte=date(2024, 2, 1), updated_on__gte=date(2024, 1, 1))
+        self.assertEqual(issues.manager.params['start_date'], '><2024-01-01|2024-01-31')
+        self.assertEqual(issues.manager.params['due_date'], '<=2024-02-01')
+        self.assertEqual(self.patch_requests.call_count, 1)
+        entries = self.redmine.time_entry.all().filter(spent_on__gte=date(2024, 1, 1))
+        self.assertEqual(entries.manager.params, {'spent_on': '>=2024-01-01'})
+        self.assertEqual(self.patch_requests.call_count, 1)
+        issues = self.redmine.issue.all().filter(start_date__gt=date(2024, 1, 1))
+        self.assertIsNone(issues.manager.params.get('start_date'))
+        issues = self.redmine.issue.all().filter(start_date__gte=datetime(2024, 1, 1))
+        self.assertIsNone(issues.manager.params.get('start_date'))
+
+    def test_filter_pushdown(self):
+        self.response.json.return_value = {'issues': response['issues'][:1]}
+        issues = self.redmine.issue.all().filter(id__in=[1, 3], status__id=2)
+        self.assertEqual(self.patch_requests.call_count, 0)
+        self.assertEqual(issues.manager.url, f'{self.url}/issues.json')
+        self.assertEqual([issue.id for issue in issues.filter(subject='Foo')], [1])
+        self.assertEqual(self.patch_requests.call_args[1]['params']['issue_id'], '1,3')
+        self.assertEqual(self.patch_requests.call_args[1]['params']['status_id'], '2')
+        self.assertEqual([issue.id for issue in self.redmine.issue.all().filter(tracker__id=1, subject='Bar')], [])
+        self.assertEqual(self.patch_requests.call_args[1]['params']['tracker_id'], '1')
+        issues = self.redmine.issue.filter(status_id='open').filter(status__id=2, assigned_to__id__in=(1, 2))
+        self.assertEqual(list(issues), [])
+        self.assertEqual(self.patch_requests.call_args[1]['params']['status_id'], 'open')
+        self.assertEqual(self.patch_requests.call_args[1]['params']['assigned_to_id'], '1|2')
+
+    def test_filter_pushdown_respects_default_filters(self):
+        self.response.json.return_value = {'issues': [{'id': 1, 'status': {'id': 5}}, {'id': 2, 'status': {'id': 1}}]}
+        issues = self.redmine.issue.filter(project_id=1).filter(status__id=5)
+        self.assertEqual([issue.id for issue in issues], [1])
+        self.assertNotIn('status_id', self.patch_requests.call_args[1]['params'])
+        issues = self.redmine.issue.filter(project_id=1, status_id='*').filter(status__id=5)
+        self.assertEqual(issues.manager.params['status_id'], '5')
+
+    def test_filter_pushdown_resets_total_count(self):
+        self.response.json.return_value = {'total_count': 30, 'limit': 1, 'offset': 0, 'issues': [{'id': 1}]}
+        issues = self.redmine.issue.all()
+        self.assertEqual(issues.count(), 30)
+        self.response.json.return_value = {'total_count': 2, 'limit': 1, 'offset': 0, 'issues': [{'id': 1}]}
+        self.assertEqual(issues.filter(status__id=5).count(), 2)
+        self.assertEqual(self.patch_requests.call_count, 2)
+        self.assertEqual(self.patch_requests.call_args[1]['params']['status_id'], '5')
+
+    def test_filter_pushdown_fallback(self):
+        issues = self.redmine.issue.all()
+        self.assertEqual(issues.filter(status__id='2').manager, issues.manager)
+        self.assertEqual(issues.filter(status__name='New').manager, issues.manager)
+        self.assertEqual(issues[:2].filter(id=1).manager, issues.manager)
+
+    def test_filter_pushdown_skipped_for_limit_and_offset_params(self):
+        self.response.json.return_value = {'issues': [{'id': 1, 'tracker': {'id': 1}}, {'id': 2, 'tracker': {'id': 2}}]}
+        issues = self.redmine.issue.all(limit=10).filter(tracker__id=1)
+        self.assertEqual([issue.id for issue in issues], [1])
+        self.assertNotIn('tracker_id', self.patch_requests.call_args[1]['params'])
+        self.assertEqual(self.patch_requests.call_args[1]['params']['limit'], 10)
+        self.response.json.return_value = {'total_count': 6, 'limit': 100, 'offset': 5, 'issues': [{'id': 1}]}
+        issues = self.redmine.issue.all(offset=5).filter(id=1)
+        self.assertEqual([issue.id for issue in issues], [1])
+        self.assertNotIn('issue_id', self.patch_requests.call_args[1]['params'])
+        self.assertEqual(self.patch_requests.call_args[1]['params']['offset'], 5)
+
     def test_update_method(self):
         issues = self.redmine.issue.all().update(subject='FooBar')
         self.assertEqual(issues[0].subject, 'FooBar')
@@ -173,6 +568,74 @@ class ResultSetTestCase(BaseRedmineTestCase):
         self.assertEqual(issues[1], 2)
         self.assertEqual(issues[2], 3)
 
+    def test_to_columns_method(self):
+        self.response.json.return_value = {'total_count': 2, 'limit': 100, 'offset': 0, 'issues': [
+            {'id': 1, 'status': {'id': 1, 'name': 'New'}, 'start_date': '2026-01-01',
+             'custom_fields': [{'id': 4, 'value': 'foo'}, {'id': 5, 'value': 'bar'}]},
+            {'id': 2, 'status': {'id': 2, 'name': 'Closed'}, 'custom_fields': [{'id': 4, 'value': 'baz'}]},
+        ]}
+        issues = self.redmine.issue.all()
+
+        with mock.patch.object(issues.manager, 'to_resource') as to_resource:
+            columns = issues.to_columns('id', 'status.name', 'start_date', 'custom_fields[id=5].value', 'foo.bar')
+            self.assertEqual(to_resource.call_count, 0)
+
+        self.assertEqual(columns, {
+            'id': [1, 2],
+            'status.name': ['New', 'Closed'],
+            'start_date': ['2026-01-01', None],
+            'custom_fields[id=5].value': ['bar', None],
+            'foo.bar': [None, None],
+        })
+        self.assertIsNone(issues._resources)
+
+    def test_to_columns_method_without_fields(self):
+        self.response.json.return_value = {'issues': [{'id': 1}, {'id': 2, 'subject': 'Bar'}, {'id': 3}]}
+        self.assertEqual(self.redmine.issue.all().to_columns(), {'id': [1, 2, 3], 'subject': [None, 'Bar', None]})
+
+    def test_to_pandas_method(self):
+        self.response.json.return_value = {'issues': [
+            {'id': 1, 'start_date': '2026-01-01', 'created_on': '2026-01-01T10:00:00Z'},
+            {'id': 2, 'start_date': None, 'created_on': '2026-01-02T10:00:00Z'},
+        ]}
+        pandas = mock.Mock()
+
+        with mock.patch.dict('sys.modules', {'pandas': pandas}):
+            self.assertEqual(self.redmine.issue.all().to_pandas(), pandas.DataFrame.return_value)
+
+        pandas.to_datetime.assert_has_calls([
+            mock.call(['2026-01-01', None], format='%Y-%m-%d', utc=False),
+            mock.call(['2026-01-01T10:00:00Z', '2026-01-02T10:00:00Z'], format='%Y-%m-%dT%H:%M:%SZ', utc=True),
+        ])
+        self.assertEqual(pandas.DataFrame.call_args[0][0]['id'], [1, 2])
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'requires pyarrow')
+    def test_to_arrow_method(self):
+        import pyarrow
+        from datetime import date, datetime, timezone
+        self.response.json.return_value = {'issues': [
+            {'id': 1, 'start_date': '2026-01-01', 'created_on': '2026-01-01T10:00:00Z', 'notes': '2026-01-01',
+             'custom_fields': [{'id': 5, 'value': 1}]},
+            {'id': 2, 'start_date': None, 'created_on': '2026-01-02T10:00:00Z', 'notes': 'Foo',
+             'custom_fields': [{'id': 5, 'value': 'Bar'}]},
+        ]}
+        table = self.redmine.issue.all().to_arrow(
+            'id', 'start_date', 'created_on', 'notes', 'custom_fields[id=5].value')
+        self.assertEqual(table.schema.field('id').type, pyarrow.int64())
+        self.assertEqual(table.schema.field('start_date').type, pyarrow.date32())
+        self.assertEqual(table.schema.field('created_on').type, pyarrow.timestamp('s', tz='UTC'))
+        self.assertEqual(table.schema.field('notes').type, pyarrow.string())
+        self.assertEqual(table.column('start_date').to_pylist(), [date(2026, 1, 1), None])
+        self.assertEqual(table.column('created_on').to_pylist()[1],
+                         datetime(2026, 1, 2, 10, tzinfo=timezone.utc))
+        self.assertEqual(table.column('notes').to_pylist(), ['2026-01-01', 'Foo'])
+        self.assertEqual(table.column('custom_fields[id=5].value').to_pylist(), ['1', 'Bar'])
+
+    def test_to_pandas_and_to_arrow_methods_require_libraries(self):
+        with mock.patch.dict('sys.modules', {'pandas': None, 'pyarrow': None}):
+            self.assertRaises(ImportError, lambda: self.redmine.issue.all().to_pandas())
+            self.assertRaises(ImportError, lambda: self.redmine.issue.all().to_arrow())
+
     @mock.patch('redminelib.open', mock.mock_open(), create=True)
     def test_export(self):
         self.response.iter_content = lambda chunk_size: (str(num) for num in range(0, 5))
@@ -216,6 +679,23 @@ class ResultSetTestCase(BaseRedmineTestCase):
         self.response.status_code = 999
         self.assertRaises(exceptions.UnknownError, lambda: self.redmine.issue.all().export('foo'))
 
+    def test_filter_lookups_with_null_values(self):
+        from datetime import date
+        self.response.json.return_value = {'issues': [
+            {'id': 1, 'subject': 'Foo', 'due_date': '2024-01-01', 'notes': 'Foo bar'},
+            {'id': 2, 'subject': 'Bar', 'due_date': None, 'notes': None},
+        ]}
+        issues = self.redmine.issue.all()
+        list(issues)
+        self.assertEqual([issue.id for issue in issues.filter(due_date__lt=date(2024, 2, 1))], [1])
+        self.assertEqual([issue.id for issue in issues.filter(due_date__gte=date(2023, 1, 1))], [1])
+        self.assertEqual([issue.id for issue in issues.filter(
+            due_date__range=(date(2023, 1, 1), date(2024, 2, 1)))], [1])
+        self.assertEqual([issue.id for issue in issues.filter(notes__contains='bar')], [1])
+        self.assertEqual([issue.id for issue in issues.filter(notes__icontains='BAR')], [1])
+        self.assertEqual([issue.id for issue in issues.filter(notes__startswith='Foo')], [1])
+        self.assertRaises(exceptions.ResourceSetFilterLookupError, lambda: issues.filter(due_date__lt=1))
+
     def test_filter_no_filters_exception(self):
         self.assertRaises(exceptions.ResourceNoFiltersProvidedError, lambda: self.redmine.issue.all().filter())
 